@@ -37,8 +37,14 @@ docreader-automation/
 │   ├── __init__.py
 │   ├── aws_helper.py                     # AWS S3, Textract interactions
 │   ├── database_helper.py                # Database operations
+│   ├── jar_helper.py                     # Streaming diagram XML from Generated.jar
+│   ├── mito_validator.py                 # Parallel all-diagram MITO verification
 │   ├── pdf_helper.py                     # PDF validation/operations
 │   ├── api_helper.py                     # API testing support
+│   ├── fixture_helper.py                 # Fixture lookup from the index
+│   ├── keyword_profiler.py               # Keyword timing listener (--listener)
+│   ├── ui_helper.py                      # Condition-based click and settle waits
+│   ├── browser_pool.py                   # Warm logged-in browser per pabot worker
 │   └── report_generator.py               # Custom reporting
 │
 ├── tests/                                # Test suites
@@ -58,7 +64,9 @@ docreader-automation/
 ├── test_data/                            # Test files and data
 │   ├── valid_pdfs/
 │   ├── invalid_pdfs/
-│   └── expected_outputs/
+│   ├── expected_outputs/
+│   ├── fixture_index.json                # Fixture fingerprints (generated)
+│   └── fixture_index.green.json          # Fingerprints of the last green test-changed run
 │
 ├── results/                              # Test execution results (git-ignored)
 │   ├── qa/
@@ -67,6 +75,14 @@ docreader-automation/
 ├── utils/                                # Utility scripts
 │   ├── setup_env.sh
 │   ├── clean_results.sh
+│   ├── benchmark.py                      # Micro-benchmarks for hot paths
+│   ├── stub_api_server.py                # Local stand-in for the status API
+│   ├── build_fixture_index.py            # Incremental fixture fingerprint index
+│   ├── pabot_scheduler.py                # Duration-aware pabot ordering
+│   ├── merge_results.py                  # Parallel output.xml merge
+│   ├── results_history.py                # Query the SQLite results history
+│   ├── verify_mito_project.py            # Batch-verify every diagram of a project
+│   ├── shutdown_browsers.py              # Stop a run's pooled browsers
 │   └── generate_report.py
 │
 ├── .pre-commit-config.yaml              # Pre-commit hooks configuration
@@ -96,6 +112,7 @@ botocore==1.34.0
 PyPDF2==3.0.1
 pdf2image==1.16.3
 Pillow==10.2.0
+numpy==1.26.3
 
 # Database
 pymysql==1.1.0
@@ -104,6 +121,7 @@ psycopg2-binary==2.9.9
 # Utilities
 pyyaml==6.0.1
 python-dotenv==1.0.0
+requests==2.31.0
 openpyxl==3.1.2
 Faker==22.0.0
 
@@ -147,6 +165,10 @@ cache:
   key: ${CI_COMMIT_REF_SLUG}
   paths:
     - .cache/pip
+    - .cache/textract
+    - .cache/rendered
+    - .cache/timings
+    - .cache/history
     - venv/
 
 # Templates
@@ -185,6 +207,10 @@ code-quality:
     - echo "✅ Running Flake8..."
     - flake8 libraries/ utils/ --max-line-length=120
     
+    # Startup regressions
+    - echo "⏱️ Checking config import time..."
+    - python utils/benchmark.py import-time --max-ms 50
+    
   allow_failure: false
   only:
     - merge_requests
@@ -240,6 +266,8 @@ robot-tidy:
     reports:
       junit: results/${ENV}/xunit.xml
     expire_in: 30 days
+  after_script:
+    - venv/bin/python utils/shutdown_browsers.py || true
 
 smoke-tests-qa:
   stage: test-qa
@@ -292,15 +320,27 @@ parallel-tests-qa:
   variables:
     ENV: "qa"
   script:
+    - echo "📅 Scheduling tests from previous timings..."
+    - python utils/pabot_scheduler.py
+        --history ".cache/timings/*.xml"
+        --exclude slow
+        --processes 4
+        --output results/qa/ordering.txt
+        tests/functional/
     - echo "⚡ Running Tests in Parallel on QA..."
     - pabot 
         --processes 4
+        --ordering results/qa/ordering.txt
         --outputdir results/qa
         --variable ENV:qa
         --variable CONFIG_FILE:config/qa.yaml
         --exclude slow
         ${ROBOT_OPTIONS}
         tests/functional/
+  after_script:
+    - venv/bin/python utils/shutdown_browsers.py || true
+    - mkdir -p .cache/timings
+    - cp results/qa/output.xml .cache/timings/output-qa.xml || true
   only:
     - schedules
   environment:
@@ -381,12 +421,15 @@ merge-results:
   stage: report
   image: python:${PYTHON_VERSION}
   <<: *setup_env
+  variables:
+    # Set to "--rebot" on a pipeline for rebot's log/report HTML (re-reads every output.xml)
+    MERGE_OPTIONS: ""
   script:
     - echo "🔗 Merging Test Results..."
-    - rebot 
-        --outputdir results/merged
+    - python utils/merge_results.py
+        --output-dir results/merged
         --name "Combined Results"
-        --merge
+        ${MERGE_OPTIONS}
         results/qa/output.xml results/prod/output.xml || true
   artifacts:
     when: always
@@ -484,7 +527,7 @@ output = .robocop_cache/robocop.xml
 6. Makefile
 makefile# dOCReader Automation Framework Makefile
 
-.PHONY: help setup install install-dev clean test test-qa test-prod test-smoke test-parallel format lint robocop pre-commit
+.PHONY: help setup install install-dev clean test test-qa test-prod test-smoke test-parallel format lint robocop pre-commit benchmark fixture-index test-changed test-profile
 
 # Variables
 PYTHON := python3.11
@@ -492,6 +535,11 @@ PIP := $(PYTHON) -m pip
 ROBOT := robot
 VENV := venv
 ENV ?= qa
+# Pooled browsers (and their profiles) belong to one run
+ifndef BROWSER_POOL_RUN_ID
+BROWSER_POOL_RUN_ID := local-$(shell date +%s%N)
+endif
+export BROWSER_POOL_RUN_ID
 
 help:
 	@echo "dOCReader Test Automation Framework"
@@ -507,11 +555,15 @@ help:
 	@echo "  test-qa        - Run tests on QA environment"
 	@echo "  test-prod      - Run tests on Production environment"
 	@echo "  test-parallel  - Run tests in parallel"
+	@echo "  test-changed   - Run only tests whose fixture PDFs changed"
+	@echo "  test-profile   - Run tests with the keyword profiler listener"
+	@echo "  fixture-index  - Rebuild the fixture fingerprint index"
 	@echo "  format         - Format Python and Robot code"
 	@echo "  lint           - Run all linters"
 	@echo "  robocop        - Run Robocop checks"
 	@echo "  pre-commit     - Install pre-commit hooks"
 	@echo "  report         - Generate custom test report"
+	@echo "  benchmark      - Run framework micro-benchmarks"
 	@echo ""
 	@echo "Example: make test ENV=qa"
 
@@ -549,7 +601,8 @@ test:
 		--variable ENV:$(ENV) \
 		--variable CONFIG_FILE:config/$(ENV).yaml \
 		--xunit xunit.xml \
-		tests/
+		tests/; \
+		status=$$?; $(PYTHON) utils/shutdown_browsers.py; exit $$status
 
 test-smoke:
 	@echo "🔥 Running smoke tests on $(ENV)..."
@@ -568,12 +621,49 @@ test-prod:
 
 test-parallel:
 	@echo "⚡ Running tests in parallel on $(ENV)..."
+	. $(VENV)/bin/activate && $(PYTHON) utils/pabot_scheduler.py \
+		--history "results/$(ENV)/parallel/output.xml" \
+		--processes 4 \
+		--output results/$(ENV)/ordering.txt \
+		tests/
 	. $(VENV)/bin/activate && pabot \
 		--processes 4 \
+		--ordering results/$(ENV)/ordering.txt \
 		--outputdir results/$(ENV)/parallel \
 		--variable ENV:$(ENV) \
 		--variable CONFIG_FILE:config/$(ENV).yaml \
+		tests/; \
+		status=$$?; $(PYTHON) utils/shutdown_browsers.py; exit $$status
+
+test-profile:
+	@echo "🔬 Profiling keywords on $(ENV)..."
+	. $(VENV)/bin/activate && $(ROBOT) \
+		--outputdir results/$(ENV)/profile \
+		--variable ENV:$(ENV) \
+		--variable CONFIG_FILE:config/$(ENV).yaml \
+		--listener libraries/keyword_profiler.py \
 		tests/
+	. $(VENV)/bin/activate && $(PYTHON) utils/generate_report.py --env $(ENV) \
+		--output-xml results/$(ENV)/profile/output.xml --output-dir results/$(ENV)/profile --no-history
+	@echo "🔥 Flame graph input: results/$(ENV)/profile/keyword_profile.folded"
+
+fixture-index:
+	@echo "📇 Updating fixture index..."
+	. $(VENV)/bin/activate && $(PYTHON) utils/build_fixture_index.py
+
+test-changed:
+	@echo "🔁 Running tests affected by fixture changes on $(ENV)..."
+	. $(VENV)/bin/activate && $(PYTHON) utils/build_fixture_index.py \
+		--changed-only --argfile results/$(ENV)/changed_tests.args
+	@if [ -s results/$(ENV)/changed_tests.args ]; then \
+		. $(VENV)/bin/activate && $(ROBOT) \
+			--outputdir results/$(ENV)/changed \
+			--variable ENV:$(ENV) \
+			--variable CONFIG_FILE:config/$(ENV).yaml \
+			--argumentfile results/$(ENV)/changed_tests.args \
+			tests/; \
+	else echo "✅ No tests affected by fixture changes"; fi
+	. $(VENV)/bin/activate && $(PYTHON) utils/build_fixture_index.py --commit
 
 format:
 	@echo "🎨 Formatting code..."
@@ -606,6 +696,13 @@ report:
 	. $(VENV)/bin/activate && $(PYTHON) utils/generate_report.py --env $(ENV)
 	@echo "✅ Report generated"
 
+benchmark:
+	@echo "⏱️  Running micro-benchmarks..."
+	. $(VENV)/bin/activate && $(PYTHON) utils/benchmark.py config-lookup --config config/$(ENV).yaml
+	. $(VENV)/bin/activate && $(PYTHON) utils/benchmark.py import-time --max-ms 50
+	. $(VENV)/bin/activate && $(PYTHON) utils/benchmark.py report-parse --keywords 200000
+	@echo "✅ Benchmarks complete"
+
 .DEFAULT_GOAL := help
 7. config/qa.yaml
 yaml# QA Environment Configuration
@@ -621,11 +718,13 @@ credentials:
   api_key: "${QA_API_KEY}"
 
 database:
+  driver: "postgresql"                   # postgresql | mysql | sqlite (offline stand-in)
   host: "db-qa.siemens-energy.com"
   port: 5432
   name: "docreader_qa"
   username: "${DB_QA_USERNAME}"
   password: "${DB_QA_PASSWORD}"
+  pool_size: 4
 
 aws:
   region: "us-east-1"
@@ -634,6 +733,10 @@ aws:
   sagemaker_endpoint: "docreader-qa-ml-model"
   access_key_id: "${AWS_QA_ACCESS_KEY}"
   secret_access_key: "${AWS_QA_SECRET_KEY}"
+  textract_cache:
+    dir: ".cache/textract"
+    max_size_mb: 500
+    ttl_hours: 168
 
 test_data:
   upload_path: "test_data/valid_pdfs/"
@@ -645,12 +748,19 @@ timeouts:
   upload: 120
   processing: 600
   api_response: 10
+  element: 10                            # Wait For Element And Click: visible and enabled
+  dom_settle: 2                          # Upper bound for the post-click DOM settle wait
+
+http:
+  pool_maxsize: 10
 
 browser:
   name: "chrome"
   headless: true
   window_size: "1920x1080"
   implicit_wait: 5
+  click_wait: "condition"                # condition | compat (keeps the 0.5s sleep, reports savings)
+  dashboard_path: "/dashboard"           # Pooled browser reset target
 
 retry:
   max_attempts: 3
@@ -678,11 +788,13 @@ credentials:
   api_key: "${PROD_API_KEY}"
 
 database:
+  driver: "postgresql"                   # postgresql | mysql | sqlite (offline stand-in)
   host: "db-prod.siemens-energy.com"
   port: 5432
   name: "docreader_prod"
   username: "${DB_PROD_USERNAME}"
   password: "${DB_PROD_PASSWORD}"
+  pool_size: 4
 
 aws:
   region: "us-east-1"
@@ -691,6 +803,10 @@ aws:
   sagemaker_endpoint: "docreader-prod-ml-model"
   access_key_id: "${AWS_PROD_ACCESS_KEY}"
   secret_access_key: "${AWS_PROD_SECRET_KEY}"
+  textract_cache:
+    dir: ".cache/textract"
+    max_size_mb: 500
+    ttl_hours: 168
 
 test_data:
   upload_path: "test_data/valid_pdfs/"
@@ -702,12 +818,19 @@ timeouts:
   upload: 120
   processing: 600
   api_response: 10
+  element: 10                            # Wait For Element And Click: visible and enabled
+  dom_settle: 2                          # Upper bound for the post-click DOM settle wait
+
+http:
+  pool_maxsize: 10
 
 browser:
   name: "chrome"
   headless: true
   window_size: "1920x1080"
   implicit_wait: 5
+  click_wait: "condition"                # condition | compat (keeps the 0.5s sleep, reports savings)
+  dashboard_path: "/dashboard"           # Pooled browser reset target
 
 retry:
   max_attempts: 2
@@ -727,50 +850,224 @@ reporting:
 python"""Configuration Manager for environment-specific settings."""
 
 import os
-import yaml
+import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# yaml, json and hashlib are imported inside the loaders so that importing
+# this module (e.g. as a Robot Variables file) stays cheap until a value is read.
+
+# Resolved-config snapshots shared by all pabot workers of a run.
+# Defaults to <tempdir>/docreader-config-<uid> when unset.
+SNAPSHOT_DIR = os.getenv('CONFIG_SNAPSHOT_DIR')
+SNAPSHOT_ENABLED = os.getenv('CONFIG_SNAPSHOT', '1') != '0'
+
+# ${VAR} or ${VAR:-default}, anywhere inside a string value.
+_ENV_PLACEHOLDER = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}')
 
 
 class ConfigManager:
     """Manages configuration loading and environment variables."""
 
-    def __init__(self, config_file: str = None):
+    def __init__(self, config_file: str = None, lazy: bool = False):
         """
         Initialize configuration manager.
         
         Args:
             config_file: Path to configuration YAML file
+            lazy: Defer reading and parsing the file until the first lookup
         """
         self.config_file = config_file or os.getenv('CONFIG_FILE', 'config/qa.yaml')
-        self.config = self._load_config()
+        self._env_names = []
+        self._config = None
+        self._index = None
+        if not lazy:
+            self._ensure_loaded()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Resolved configuration, loaded on first access in lazy mode."""
+        if self._index is None:
+            self._ensure_loaded()
+        return self._config
+
+    def _ensure_loaded(self):
+        """Load the configuration and build the lookup index."""
+        self._config = self._load_resolved_config()
+        self._index = self._build_index()
+
+    def _load_resolved_config(self) -> Dict[str, Any]:
+        """Load the env-substituted config, reusing a valid snapshot if present."""
+        config_path = Path(self.config_file)
+        
+        if not config_path.exists():
+            raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
+        
+        stat = config_path.stat()
+        snapshot = self._read_snapshot(stat)
+        if snapshot is not None:
+            return snapshot
+        
+        self._config = self._load_config()
         self._substitute_env_vars()
+        self._write_snapshot(stat)
+        return self._config
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
+        import yaml
+
         config_path = Path(self.config_file)
         
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
         
         with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+            text = file.read()
+        self._env_names = sorted({name for name, _ in _ENV_PLACEHOLDER.findall(text)})
+        return yaml.safe_load(text)
+
+    def _snapshot_path(self) -> Path:
+        """Snapshot file location for this config file."""
+        import hashlib
+        import tempfile
+
+        user = os.getuid() if hasattr(os, 'getuid') else os.getenv('USERNAME', 'user')
+        snapshot_dir = SNAPSHOT_DIR or os.path.join(tempfile.gettempdir(), f'docreader-config-{user}')
+        source = str(Path(self.config_file).resolve())
+        digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+        return Path(snapshot_dir) / f"{Path(self.config_file).stem}-{digest}.json"
+
+    @staticmethod
+    def _is_private(path: Path) -> bool:
+        """True if ``path`` belongs to the current user and is not accessible to group or others."""
+        if not hasattr(os, 'getuid'):
+            return True
+        stat = path.stat()
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o077
+
+    @staticmethod
+    def _env_digest(names) -> str:
+        """Hash the current values of the referenced environment variables."""
+        import hashlib
+
+        digest = hashlib.sha256()
+        for name in names:
+            digest.update(f"{name}={os.getenv(name)}\0".encode())
+        return digest.hexdigest()
+
+    def _read_snapshot(self, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the snapshotted config if it matches the YAML file and env."""
+        if not SNAPSHOT_ENABLED:
+            return None
+        import json
+
+        path = self._snapshot_path()
+        try:
+            # Ignore snapshots another user could have planted or changed
+            if not (self._is_private(path.parent) and self._is_private(path)):
+                return None
+            with open(path, 'r') as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            return None
+        
+        if (snapshot.get('mtime_ns') != stat.st_mtime_ns
+                or snapshot.get('size') != stat.st_size
+                or snapshot.get('env_digest') != self._env_digest(snapshot.get('env_names', []))):
+            return None
+        self._env_names = snapshot['env_names']
+        return snapshot['config']
+
+    def _write_snapshot(self, stat: os.stat_result):
+        """Atomically write the resolved config for other workers to reuse."""
+        if not SNAPSHOT_ENABLED:
+            return
+        import json
+        import tempfile
+
+        snapshot = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'env_names': self._env_names,
+            'env_digest': self._env_digest(self._env_names),
+            'config': self._config,
+        }
+        try:
+            text = json.dumps(snapshot)
+        except (TypeError, ValueError):
+            return
+        if json.loads(text)['config'] != self._config:
+            # YAML values JSON cannot round-trip (dates, non-string keys): no snapshot
+            return
+        path = self._snapshot_path()
+        try:
+            # Snapshots hold resolved credentials, so keep them owner-only.
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_private(path.parent):
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as file:
+                file.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
 
     def _substitute_env_vars(self):
-        """Replace environment variable placeholders in config."""
-        self._recursive_substitute(self.config)
-
-    def _recursive_substitute(self, obj):
-        """Recursively substitute environment variables."""
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                obj[key] = self._recursive_substitute(value)
-        elif isinstance(obj, list):
-            return [self._recursive_substitute(item) for item in obj]
-        elif isinstance(obj, str) and obj.startswith('${') and obj.endswith('}'):
-            env_var = obj[2:-1]
-            return os.getenv(env_var, obj)
-        return obj
+        """
+        Replace environment variable placeholders in config.
+        
+        Supports ``${VAR}`` and ``${VAR:-default}`` anywhere inside string
+        values. Unset variables without a default are left untouched. The
+        tree is walked iteratively and each distinct placeholder is resolved
+        only once.
+        """
+        resolved = {}
+
+        def replace(match):
+            placeholder = match.group(0)
+            if placeholder not in resolved:
+                name, default = match.groups()
+                value = os.getenv(name)
+                if default is not None and not value:
+                    value = default
+                resolved[placeholder] = placeholder if value is None else value
+            return resolved[placeholder]
+
+        pending = [self._config]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, dict):
+                items = node.items()
+            elif isinstance(node, list):
+                items = enumerate(node)
+            else:
+                continue
+            for key, value in items:
+                if isinstance(value, str):
+                    if '${' in value:
+                        node[key] = _ENV_PLACEHOLDER.sub(replace, value)
+                elif isinstance(value, (dict, list)):
+                    pending.append(value)
+
+    def _build_index(self) -> Dict[str, Any]:
+        """Flatten the config into a dot-path -> value lookup table."""
+        index = {}
+        pending = [('', self._config or {})]
+        while pending:
+            prefix, node = pending.pop()
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+                path = prefix + key
+                index[path] = value
+                if isinstance(value, dict):
+                    pending.append((path + '.', value))
+        return index
+
+    def reload(self):
+        """Re-read the configuration file and rebuild the lookup index."""
+        self._ensure_loaded()
 
     def get(self, key_path: str, default=None):
         """
@@ -783,16 +1080,9 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key_path.split('.')
-        value = self.config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        if self._index is None:
+            self._ensure_loaded()
+        return self._index.get(key_path, default)
 
     def get_env_name(self) -> str:
         """Get current environment name."""
@@ -814,11 +1104,16 @@ class ConfigManager:
 _config_instance = None
 
 
-def get_config(config_file: str = None) -> ConfigManager:
-    """Get or create global configuration instance."""
+def get_config(config_file: str = None, lazy: bool = True) -> ConfigManager:
+    """
+    Get or create global configuration instance.
+    
+    The global instance is lazy by default, so suites that never read a
+    config value do not pay for YAML parsing.
+    """
     global _config_instance
     if _config_instance is None or config_file:
-        _config_instance = ConfigManager(config_file)
+        _config_instance = ConfigManager(config_file, lazy=lazy)
     return _config_instance
 10. resources/keywords/common_keywords.robot
 robotframework*** Settings ***
@@ -828,6 +1123,9 @@ Library          Collections
 Library          String
 Library          OperatingSystem
 Library          ../../libraries/pdf_helper.py
+Library          ../../libraries/api_helper.py
+Library          ../../libraries/ui_helper.py
+Library          ../../libraries/browser_pool.py
 Variables        ../../config/config_manager.py
 
 *** Variables ***
@@ -868,35 +1166,14 @@ Close Application
     Close All Browsers
     Log    Application closed    INFO
 
-Wait For Element And Click
-    [Documentation]    Waits for element and clicks it
-    [Arguments]    ${locator}    ${timeout}=10s
-    
-    Wait Until Element Is Visible    ${locator}    timeout=${timeout}
-    Wait Until Element Is Enabled    ${locator}    timeout=${timeout}
-    Click Element    ${locator}
-    Sleep    0.5s
-
 Wait For Processing To Complete
-    [Documentation]    Waits for document processing with status checks
-    [Arguments]    ${document_id}    ${max_wait_time}=600s
-    
-    ${start_time}=    Get Time    epoch
-    ${timeout}=    Evaluate    ${start_time} + ${max_wait_time}
+    [Documentation]    Waits for document processing via the status API
+    ...                (exponential backoff, or long-poll with mode=longpoll)
+    [Arguments]    ${document_id}    ${max_wait_time}=600s    ${mode}=poll
     
-    FOR    ${i}    IN RANGE    999999
-        ${current_time}=    Get Time    epoch
-        Exit For Loop If    ${current_time} > ${timeout}
-        
-        ${status}=    Get Document Status    ${document_id}
-        Exit For Loop If    '${status}' == 'Ready To Export'
-        Exit For Loop If    '${status}' == 'Processing Failed'
-        
-        Sleep    5s
-        Reload Page
-    END
-    
-    ${final_status}=    Get Document Status    ${document_id}
+    ${final_status}=    Wait For Document Status    ${document_id}
+    ...    timeout=${max_wait_time}    mode=${mode}
+    Reload Page
     Should Be Equal    ${final_status}    Ready To Export
     Log    Document ${document_id} processing completed    INFO
 
@@ -987,6 +1264,3780 @@ Get Test Credentials
     
     [Return]    ${creds}
 
+12. utils/benchmark.py
+python"""Micro-benchmarks for framework hot paths."""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from config.config_manager import ConfigManager  # noqa: E402
+
+LOOKUP_KEYS = [
+    'environment.url',
+    'database.host',
+    'aws.s3_bucket',
+    'timeouts.processing',
+    'browser.headless',
+    'missing.key.path',
+]
+
+
+def _walk(config, key_path, default=None):
+    """Reference implementation: split the path and walk the nested dict."""
+    value = config
+    for key in key_path.split('.'):
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            return default
+    return value
+
+
+def bench_config_lookup(config_file: str, number: int):
+    """Compare indexed ConfigManager.get against the nested-dict walk."""
+    config = ConfigManager(config_file)
+
+    def indexed():
+        for key in LOOKUP_KEYS:
+            config.get(key)
+
+    def walked():
+        for key in LOOKUP_KEYS:
+            _walk(config.config, key)
+
+    results = {
+        'indexed': min(timeit.repeat(indexed, number=number, repeat=5)),
+        'walk': min(timeit.repeat(walked, number=number, repeat=5)),
+    }
+    lookups = number * len(LOOKUP_KEYS)
+    for name, seconds in results.items():
+        print(f"{name:<10} {seconds * 1e9 / lookups:8.1f} ns/lookup")
+    print(f"speedup    {results['walk'] / results['indexed']:8.2f}x")
+
+
+def _import_times(module: str):
+    """Run ``python -X importtime`` for a module and parse the report."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split(':', 1)[1].split('|')
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def bench_import_time(module: str, repeat: int, max_ms: float = None, top: int = 10) -> int:
+    """Report the cumulative import time of a module, failing above max_ms."""
+    runs = [_import_times(module) for _ in range(repeat)]
+    best = min(runs, key=lambda timings: timings.get(module, 0))
+    total_ms = best.get(module, 0) / 1000
+
+    print(f"{module}: {total_ms:.2f} ms (best of {repeat})")
+    heaviest = sorted(best.items(), key=lambda item: item[1], reverse=True)[:top]
+    for name, micros in heaviest:
+        print(f"  {micros / 1000:8.2f} ms  {name}")
+
+    if max_ms is not None and total_ms > max_ms:
+        print(f"❌ Import time {total_ms:.2f} ms exceeds budget of {max_ms} ms")
+        return 1
+    return 0
+
+
+def write_synthetic_output(path: str, keywords: int, keywords_per_test: int = 50):
+    """Write a Robot 7 style output.xml with the given number of keywords."""
+    tests = max(keywords // keywords_per_test, 1)
+    status = '<status status="{}" start="2024-01-01T00:00:00.000000" elapsed="{}"/>'
+    with open(path, 'w') as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n<robot generator="synthetic">\n')
+        file.write('<suite id="s1" name="Synthetic">\n')
+        for t in range(tests):
+            if t % 100 == 0:
+                file.write(f'<suite id="s1-s{t // 100}" name="Suite {t // 100}">\n')
+            file.write(f'<test id="t{t}" name="Test {t}">\n')
+            for k in range(keywords_per_test):
+                file.write(f'<kw name="Keyword {k % 25}" owner="Lib{k % 3}"><arg>value</arg>'
+                           f'<msg time="2024-01-01T00:00:00.000000" level="INFO">message {k}</msg>'
+                           f'{status.format("PASS", "0.001")}</kw>\n')
+            file.write(f'<tag>tag{t % 7}</tag>{status.format("FAIL" if t % 13 == 0 else "PASS", "0.05")}'
+                       '</test>\n')
+            if t % 100 == 99 or t == tests - 1:
+                file.write(f'{status.format("PASS", "5")}</suite>\n')
+        file.write(f'{status.format("PASS", "500")}</suite>\n')
+        file.write('<statistics><total><stat pass="1" fail="0" skip="0">All Tests</stat></total>'
+                   '<tag/><suite><stat pass="1" fail="0" skip="0" id="s1" name="Synthetic">Synthetic</stat>'
+                   '</suite></statistics><errors/></robot>\n')
+
+
+_PARSE_SNIPPETS = {
+    'iterparse': 'from report_generator import parse_output; parse_output(path)',
+    'dom': 'import xml.etree.ElementTree as ET; ET.parse(path)',
+}
+
+
+def bench_report_parse(keywords: int, compare_dom: bool):
+    """Time and peak RSS of the streaming parser on a synthetic output.xml."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'output.xml')
+        write_synthetic_output(path, keywords)
+        size_mb = Path(path).stat().st_size / 1024 / 1024
+        print(f"Synthetic output.xml: {keywords:,} keywords, {size_mb:.0f} MB")
+
+        for name in ['iterparse'] + (['dom'] if compare_dom else []):
+            code = (
+                'import json, resource, sys, time\n'
+                f'sys.path.insert(0, {str(ROOT / "libraries")!r})\n'
+                f'path = {path!r}\n'
+                'start = time.perf_counter()\n'
+                f'{_PARSE_SNIPPETS[name]}\n'
+                'print(json.dumps({"seconds": time.perf_counter() - start,'
+                ' "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))\n'
+            )
+            result = json.loads(subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                               text=True, check=True).stdout)
+            print(f"{name:<10} {result['seconds']:8.2f} s  "
+                  f"{keywords / result['seconds']:12,.0f} kw/s  peak RSS {result['max_rss_mb']:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    lookup = subparsers.add_parser('config-lookup', help='ConfigManager.get vs dict walk')
+    lookup.add_argument('--config', default='config/qa.yaml')
+    lookup.add_argument('--number', type=int, default=100_000)
+
+    imports = subparsers.add_parser('import-time', help='python -X importtime for a module')
+    imports.add_argument('--module', default='config.config_manager')
+    imports.add_argument('--repeat', type=int, default=5)
+    imports.add_argument('--max-ms', type=float, default=None)
+
+    report = subparsers.add_parser('report-parse', help='Streaming output.xml parser on synthetic data')
+    report.add_argument('--keywords', type=int, default=1_000_000)
+    report.add_argument('--compare-dom', action='store_true', help='Also measure ElementTree.parse')
+
+    args = parser.parse_args()
+    if args.benchmark == 'config-lookup':
+        bench_config_lookup(args.config, args.number)
+    elif args.benchmark == 'import-time':
+        sys.exit(bench_import_time(args.module, args.repeat, args.max_ms))
+    elif args.benchmark == 'report-parse':
+        bench_report_parse(args.keywords, args.compare_dom)
+
+
+if __name__ == '__main__':
+    main()
+
+13. libraries/api_helper.py
+python"""API testing support for the dOCReader backend."""
+
+import asyncio
+import concurrent.futures
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from robot.api import logger
+from robot.utils import timestr_to_secs
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.config_manager import get_config  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'close_api_sessions',
+    'get_api_connection_stats',
+    'get_document_status_via_api',
+    'wait_for_document_status',
+    'wait_for_documents_status',
+]
+
+TERMINAL_STATUSES = ('Ready To Export', 'Processing Failed')
+BATCH_SIZE = 100
+
+
+class SessionPool:
+    """
+    Keep-alive HTTP sessions shared by every test in a worker.
+
+    One ``requests.Session`` is kept per base URL, each mounted with an
+    ``HTTPAdapter`` whose connection pool is capped per host. Request
+    latency and connection reuse are tracked so the gain can be verified.
+    """
+
+    def __init__(self, pool_maxsize: int = 10, latency_samples: int = 1000):
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[str, requests.Session] = {}
+        self._latencies = deque(maxlen=latency_samples)
+        self._lock = threading.Lock()
+
+    def session(self, base_url: str) -> requests.Session:
+        """Get or create the pooled session for a base URL."""
+        with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize,
+                                      pool_block=True)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.hooks['response'].append(self._record)
+                self._sessions[base_url] = session
+            return session
+
+    def _record(self, response, *args, **kwargs):
+        self._latencies.append(response.elapsed.total_seconds())
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection reuse and latency statistics across all sessions."""
+        requests_sent = connections_opened = 0
+        for session in list(self._sessions.values()):
+            for adapter in set(session.adapters.values()):
+                for key in adapter.poolmanager.pools.keys():
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is not None:
+                        requests_sent += pool.num_requests
+                        connections_opened += pool.num_connections
+
+        latencies = sorted(self._latencies)
+        stats = {
+            'sessions': len(self._sessions),
+            'requests': requests_sent,
+            'connections_opened': connections_opened,
+            'connection_reuse_ratio': round(1 - connections_opened / requests_sent, 3)
+            if requests_sent else 0.0,
+        }
+        if latencies:
+            stats.update({
+                'latency_avg_ms': round(1000 * sum(latencies) / len(latencies), 1),
+                'latency_p95_ms': round(1000 * latencies[int(0.95 * (len(latencies) - 1))], 1),
+                'latency_max_ms': round(1000 * latencies[-1], 1),
+            })
+        return stats
+
+    def close(self):
+        """Close every pooled session and its connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Created on first request and reused across suites
+_session_pool = None
+
+
+def _session() -> requests.Session:
+    """Pooled session for the configured ``environment.api_url``."""
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = SessionPool(get_config().get('http.pool_maxsize', 10))
+    return _session_pool.session(get_config().get('environment.api_url'))
+
+
+def _api_url(path: str) -> str:
+    """Build an absolute API URL from ``environment.api_url``."""
+    return get_config().get('environment.api_url').rstrip('/') + path
+
+
+def _headers() -> Dict[str, str]:
+    """Default request headers, including the API key when configured."""
+    headers = {'Accept': 'application/json'}
+    api_key = get_config().get('credentials.api_key')
+    if api_key and not api_key.startswith('${'):
+        headers['x-api-key'] = api_key
+    return headers
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delay seconds or HTTP date); None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return seconds if seconds > 0 else None
+
+
+def _fetch_status(document_id: str, wait: float = 0, current: Optional[str] = None):
+    """
+    Fetch a document status, optionally long-polling for a change.
+
+    Returns:
+        Tuple of (status, retry_after_seconds or None)
+    """
+    params = {}
+    if wait:
+        params['wait'] = int(wait)
+        if current:
+            params['current'] = current
+    request_timeout = get_config().get('timeouts.api_response', 10) + wait
+
+    response = _session().get(
+        _api_url(f'/documents/{document_id}/status'),
+        params=params, headers=_headers(), timeout=request_timeout,
+    )
+    if response.status_code in (429, 503):
+        return current, _retry_after_seconds(response.headers.get('Retry-After'))
+    response.raise_for_status()
+    return response.json()['status'], None
+
+
+def _fetch_statuses(document_ids: Iterable[str]) -> Dict[str, str]:
+    """Fetch the status of many documents, ``BATCH_SIZE`` ids per request."""
+    document_ids = list(document_ids)
+    request_timeout = get_config().get('timeouts.api_response', 10)
+    statuses = {}
+    for start in range(0, len(document_ids), BATCH_SIZE):
+        response = _session().get(
+            _api_url('/documents/status'),
+            params={'ids': ','.join(document_ids[start:start + BATCH_SIZE])},
+            headers=_headers(), timeout=request_timeout,
+        )
+        response.raise_for_status()
+        statuses.update(response.json()['statuses'])
+    return statuses
+
+
+class DocumentStatusWatcher:
+    """
+    Shared poller that tracks many pending documents at once.
+
+    Runs an asyncio loop in a background thread. Every tick, the status of
+    all watched documents is fetched with one batched request and each
+    waiter's future is resolved once its document reaches a terminal status.
+    """
+
+    def __init__(self, interval: float = 2.0, fetch=_fetch_statuses):
+        self.interval = interval
+        self.last_status: Dict[str, str] = {}
+        self._fetch = fetch
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}
+        self._ticker = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def watch(self, document_id: str) -> concurrent.futures.Future:
+        """Start watching a document; the future resolves to its terminal status."""
+        return asyncio.run_coroutine_threadsafe(self._watch(document_id), self._loop)
+
+    def stop(self):
+        """Stop the background loop; pending futures are cancelled."""
+        for future in self._pending.values():
+            self._loop.call_soon_threadsafe(future.cancel)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _watch(self, document_id: str) -> str:
+        future = self._pending.get(document_id)
+        if future is None:
+            future = self._pending[document_id] = self._loop.create_future()
+            if self._ticker is None or self._ticker.done():
+                self._ticker = self._loop.create_task(self._tick())
+        self._waiters[document_id] = self._waiters.get(document_id, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[document_id] -= 1
+            if not self._waiters[document_id]:
+                del self._waiters[document_id]
+                if not future.done():
+                    # Nobody is waiting any more (timeout), stop polling it.
+                    self._pending.pop(document_id, None)
+                    future.cancel()
+
+    async def _tick(self):
+        while self._pending:
+            try:
+                statuses = await self._loop.run_in_executor(None, self._fetch, list(self._pending))
+            except Exception as error:  # keep watching; waiters enforce their own timeouts
+                logger.warn(f"Batched status request failed: {error}")
+                statuses = {}
+            for document_id, status in statuses.items():
+                self.last_status[document_id] = status
+                future = self._pending.get(document_id)
+                if status in TERMINAL_STATUSES and future is not None:
+                    del self._pending[document_id]
+                    if not future.done():
+                        future.set_result(status)
+            if self._pending:
+                await asyncio.sleep(self.interval)
+
+
+# Started by the first status wait, shared by all later ones
+_watcher = None
+
+
+def _get_watcher(interval: float) -> DocumentStatusWatcher:
+    """Get or create the process-wide status watcher."""
+    global _watcher
+    if _watcher is None:
+        _watcher = DocumentStatusWatcher(interval)
+    _watcher.interval = interval
+    return _watcher
+
+
+def wait_for_documents_status(*document_ids: str, timeout: str = '600s',
+                              interval: str = '2s') -> Dict[str, str]:
+    """
+    Wait for several documents at once using the shared batch watcher.
+
+    Args:
+        document_ids: Documents to wait for
+        timeout: Maximum total wait (Robot time string)
+        interval: Time between batched status requests
+
+    Returns:
+        Dictionary of document id to terminal (or last seen) status
+    """
+    watcher = _get_watcher(timestr_to_secs(interval))
+    futures = {document_id: watcher.watch(document_id) for document_id in document_ids}
+    concurrent.futures.wait(futures.values(), timeout=timestr_to_secs(timeout))
+
+    statuses = {}
+    for document_id, future in futures.items():
+        if future.done() and not future.cancelled():
+            statuses[document_id] = future.result()
+        else:
+            future.cancel()
+            statuses[document_id] = watcher.last_status.get(document_id)
+    logger.info(f"Batch wait finished: {statuses}")
+    return statuses
+
+
+def get_api_connection_stats() -> Dict[str, Any]:
+    """Return (and log) connection reuse and latency stats for this worker."""
+    stats = _session_pool.stats() if _session_pool else {}
+    logger.info(f"API connection stats: {stats}")
+    return stats
+
+
+def close_api_sessions():
+    """Close pooled API connections, e.g. in a suite or worker teardown."""
+    if _session_pool is not None:
+        _session_pool.close()
+
+
+def get_document_status_via_api(document_id: str) -> str:
+    """Return the current processing status of a document from the API."""
+    status, _ = _fetch_status(document_id)
+    return status
+
+
+def wait_for_document_status(document_id: str, timeout: str = '600s', mode: str = 'poll',
+                             initial_delay: str = '0.5s', max_delay: str = '15s') -> str:
+    """
+    Wait until a document reaches ``Ready To Export`` or ``Processing Failed``.
+
+    Polls the status endpoint with exponential backoff and jitter. The delay
+    resets whenever the status changes, since a transition usually means the
+    next one is close. With ``mode=longpoll`` the server holds each request
+    until the status changes (or ``max_delay`` passes), so the keyword
+    returns as soon as the backend reports a terminal status. ``mode=batch``
+    joins the shared ``DocumentStatusWatcher`` instead of polling alone.
+
+    Args:
+        document_id: Document to watch
+        timeout: Maximum total wait (Robot time string)
+        mode: ``poll``, ``longpoll`` or ``batch``
+        initial_delay: First backoff delay
+        max_delay: Backoff cap, also used as the long-poll window
+
+    Returns:
+        The terminal status, or the last seen status if the timeout expires
+    """
+    if mode == 'batch':
+        return wait_for_documents_status(document_id, timeout=timeout)[document_id]
+    if mode not in ('poll', 'longpoll'):
+        raise ValueError(f"Unsupported wait mode: {mode}")
+    deadline = time.monotonic() + timestr_to_secs(timeout)
+    base_delay = timestr_to_secs(initial_delay)
+    cap = timestr_to_secs(max_delay)
+
+    status = None
+    delay = base_delay
+    polls = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        wait = min(cap, max(remaining, 0)) if mode == 'longpoll' else 0
+        started = time.monotonic()
+        previous = status
+        status, retry_after = _fetch_status(document_id, wait=wait, current=status)
+        polls += 1
+
+        if status in TERMINAL_STATUSES:
+            break
+        if status != previous:
+            delay = base_delay
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if retry_after is None and mode == 'longpoll' and time.monotonic() - started >= 1:
+            # The server held the request, so ask again straight away.
+            continue
+
+        sleep_for = retry_after or delay * random.uniform(0.5, 1.0)
+        time.sleep(min(sleep_for, remaining))
+        delay = min(cap, delay * 2)
+
+    logger.info(f"Document {document_id} status '{status}' after {polls} API call(s)")
+    return status
+
+14. utils/stub_api_server.py
+python"""Local stand-in for the dOCReader status API.
+
+Serves ``GET /documents/<id>/status`` and the batched
+``GET /documents/status?ids=a,b`` from scripted status timelines so the API
+keywords can be exercised without the real backend. Supports the
+``wait``/``current`` long-poll parameters used by ``api_helper``.
+
+Example:
+    python utils/stub_api_server.py --port 8089 \\
+        --document "doc-1=Uploaded:1,Processing:3,Ready To Export"
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Each step is (status, seconds spent in that status); the last step has None.
+Timeline = List[Tuple[str, Optional[float]]]
+
+
+def parse_timeline(spec: str) -> Timeline:
+    """Parse ``Status:seconds,...,FinalStatus`` into a timeline."""
+    steps = []
+    for part in spec.split(','):
+        status, _, seconds = part.partition(':')
+        steps.append((status.strip(), float(seconds) if seconds else None))
+    return steps
+
+
+class StubDocReaderApi:
+    """Threaded HTTP server replaying document status timelines."""
+
+    def __init__(self, documents: Dict[str, Timeline], host: str = '127.0.0.1', port: int = 0):
+        self.documents = documents
+        self.started = {}
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def status(self, document_id: str) -> Optional[str]:
+        """Current scripted status of a document, starting its clock on first use."""
+        timeline = self.documents.get(document_id)
+        if timeline is None:
+            return None
+        with self._lock:
+            started = self.started.setdefault(document_id, time.monotonic())
+        elapsed = time.monotonic() - started
+        for status, duration in timeline:
+            if duration is None or elapsed < duration:
+                return status
+            elapsed -= duration
+        return timeline[-1][0]
+
+    def start(self) -> 'StubDocReaderApi':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                parts = parsed.path.strip('/').split('/')
+                query = parse_qs(parsed.query)
+                with stub._lock:
+                    stub.request_count += 1
+
+                if parts == ['documents', 'status']:
+                    ids = [i for i in query.get('ids', [''])[0].split(',') if i]
+                    statuses = {i: stub.status(i) for i in ids}
+                    return self._send(200, {'statuses': {
+                        i: status for i, status in statuses.items() if status is not None
+                    }})
+                if len(parts) != 3 or parts[0] != 'documents' or parts[2] != 'status':
+                    return self._send(404, {'error': 'not found'})
+
+                document_id = parts[1]
+                status = stub.status(document_id)
+                if status is None:
+                    return self._send(404, {'error': f'unknown document {document_id}'})
+
+                wait = float(query.get('wait', ['0'])[0])
+                current = query.get('current', [None])[0]
+                deadline = time.monotonic() + wait
+                while status == current and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    status = stub.status(document_id)
+                self._send(200, {'id': document_id, 'status': status})
+
+            def _send(self, code, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stub dOCReader status API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--document', action='append', default=[],
+                        help='ID=Status:seconds,...,FinalStatus (repeatable)')
+    args = parser.parse_args()
+
+    documents = {}
+    for spec in args.document:
+        document_id, _, timeline = spec.partition('=')
+        documents[document_id] = parse_timeline(timeline)
+
+    stub = StubDocReaderApi(documents, args.host, args.port)
+    print(f"🧪 Stub dOCReader API listening on {stub.url}")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
+
+15. libraries/aws_helper.py
+python"""
+AWS S3 and Textract interactions.
+
+Set ``aws.endpoint_url`` in the environment config to run against a local S3
+stand-in such as LocalStack.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from robot.api import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from config.config_manager import get_config  # noqa: E402
+from fixture_helper import file_sha256  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'analyze_document_with_textract',
+    'clear_textract_cache',
+    'download_files_from_s3',
+    'upload_files_to_s3',
+]
+
+MB = 1024 * 1024
+HASH_METADATA_KEY = 'sha256'
+
+# Multipart kicks in for large drawings; small fixtures go up in one PUT.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
+def _configured(key_path: str) -> Optional[str]:
+    """Config value, or None if unset, empty or an unresolved ``${VAR}`` placeholder."""
+    value = get_config().get(key_path)
+    if isinstance(value, str) and value.startswith('${'):
+        return None
+    return value or None
+
+
+# S3 client for this process (one per pabot worker)
+_s3 = None
+
+
+def _s3_client(max_workers: int = 8):
+    """Get or create the S3 client, sized for ``max_workers`` parallel transfers."""
+    global _s3
+    if _s3 is None:
+        _s3 = boto3.client(
+            's3',
+            region_name=_configured('aws.region'),
+            endpoint_url=_configured('aws.endpoint_url'),
+            aws_access_key_id=_configured('aws.access_key_id'),
+            aws_secret_access_key=_configured('aws.secret_access_key'),
+            config=Config(max_pool_connections=max_workers * TRANSFER_CONFIG.max_concurrency),
+        )
+    return _s3
+
+
+class TextractCache:
+    """
+    Content-addressed on-disk cache of Textract responses.
+
+    Entries are keyed by the PDF's SHA-256 and the requested feature set and
+    stored as gzipped JSON. Entries older than ``ttl_seconds`` are treated as
+    misses; when the directory grows past ``max_bytes`` the least recently
+    used entries are evicted. Writes are atomic, so pabot workers can share
+    one directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, ttl_seconds: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(pdf_hash: str, features: List[str]) -> str:
+        return hashlib.sha256(f"{pdf_hash}:{','.join(sorted(features))}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached response, or None on a miss or expired entry."""
+        path = self._path(key)
+        try:
+            with gzip.open(path, 'rt') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry['created'] > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # mark as recently used
+        return entry['response']
+
+    def put(self, key: str, response: Dict[str, Any]):
+        """Store a response, then evict LRU entries above the size cap."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt') as file:
+            json.dump({'created': time.time(), 'response': response}, file)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob('*.json.gz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob('*.json.gz'):
+            path.unlink(missing_ok=True)
+
+
+def _textract_cache() -> TextractCache:
+    config = get_config()
+    return TextractCache(
+        config.get('aws.textract_cache.dir', '.cache/textract'),
+        int(config.get('aws.textract_cache.max_size_mb', 500)) * MB,
+        float(config.get('aws.textract_cache.ttl_hours', 168)) * 3600,
+    )
+
+
+def _remote_sha256(bucket: str, key: str) -> Optional[str]:
+    """SHA-256 recorded on an object at upload time, or None if absent."""
+    try:
+        head = _s3_client().head_object(Bucket=bucket, Key=key)
+    except ClientError as error:
+        if error.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+    return head.get('Metadata', {}).get(HASH_METADATA_KEY)
+
+
+def _upload_one(path: Path, bucket: str, key: str, local_hash: str = None) -> bool:
+    """Upload a file unless S3 already holds identical content."""
+    local_hash = local_hash or file_sha256(path)
+    if _remote_sha256(bucket, key) == local_hash:
+        return False
+    _s3_client().upload_file(
+        str(path), bucket, key,
+        ExtraArgs={'Metadata': {HASH_METADATA_KEY: local_hash}, 'ContentType': 'application/pdf'},
+        Config=TRANSFER_CONFIG,
+    )
+    return True
+
+
+def _download_one(bucket: str, key: str, path: Path) -> bool:
+    """Download an object unless the local copy already matches it."""
+    if path.exists() and _remote_sha256(bucket, key) == file_sha256(path):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _s3_client().download_file(bucket, key, str(path), Config=TRANSFER_CONFIG)
+    return True
+
+
+def _run_textract(bucket: str, key: str, features: List[str], timeout: float) -> Dict[str, Any]:
+    """Run an asynchronous Textract job on an S3 object and collect all pages."""
+    textract = boto3.client(
+        'textract',
+        region_name=_configured('aws.region'),
+        aws_access_key_id=_configured('aws.access_key_id'),
+        aws_secret_access_key=_configured('aws.secret_access_key'),
+    )
+    location = {'S3Object': {'Bucket': bucket, 'Name': key}}
+    if features:
+        job_id = textract.start_document_analysis(DocumentLocation=location, FeatureTypes=features)['JobId']
+        get_result = textract.get_document_analysis
+    else:
+        job_id = textract.start_document_text_detection(DocumentLocation=location)['JobId']
+        get_result = textract.get_document_text_detection
+
+    deadline = time.monotonic() + timeout
+    delay = 1.0
+    while True:
+        page = get_result(JobId=job_id)
+        if page['JobStatus'] != 'IN_PROGRESS':
+            break
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Textract job {job_id} did not finish within {timeout}s")
+        time.sleep(delay)
+        delay = min(delay * 2, 10)
+    if page['JobStatus'] != 'SUCCEEDED':
+        raise RuntimeError(f"Textract job {job_id} ended with {page['JobStatus']}: "
+                           f"{page.get('StatusMessage', '')}")
+
+    blocks = list(page.get('Blocks', []))
+    while page.get('NextToken'):
+        page = get_result(JobId=job_id, NextToken=page['NextToken'])
+        blocks.extend(page.get('Blocks', []))
+    return {'DocumentMetadata': page.get('DocumentMetadata', {}), 'Blocks': blocks}
+
+
+def analyze_document_with_textract(pdf_path: str, features: str = 'TABLES,FORMS',
+                                   bypass_cache: bool = False) -> Dict[str, Any]:
+    """
+    Run Textract on a PDF, reusing cached results for identical content.
+
+    The PDF is staged in ``aws.s3_bucket`` under ``textract-input/`` and
+    analysed asynchronously. Results are cached on disk
+    (``aws.textract_cache``) keyed by the PDF's SHA-256 and the feature set.
+
+    Args:
+        pdf_path: Local PDF to analyse
+        features: Comma-separated Textract feature types; empty for plain text detection
+        bypass_cache: Always call the live service (the fresh result still refreshes the cache)
+
+    Returns:
+        Dictionary with ``DocumentMetadata`` and ``Blocks``
+    """
+    path = Path(pdf_path)
+    feature_list = sorted(f.strip().upper() for f in features.split(',') if f.strip())
+    pdf_hash = file_sha256(path)
+    cache = _textract_cache()
+    key = cache.key(pdf_hash, feature_list)
+
+    if not bypass_cache:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"Textract cache hit for {path.name} ({','.join(feature_list) or 'TEXT'})")
+            return cached
+
+    bucket = get_config().get('aws.s3_bucket')
+    s3_key = f"textract-input/{pdf_hash}.pdf"
+    _upload_one(path, bucket, s3_key, pdf_hash)
+    response = _run_textract(bucket, s3_key, feature_list, get_config().get('timeouts.processing', 600))
+    cache.put(key, response)
+    logger.info(f"Textract analysed {path.name}: {len(response['Blocks'])} blocks")
+    return response
+
+
+def clear_textract_cache():
+    """Remove every cached Textract response."""
+    _textract_cache().clear()
+
+
+def upload_files_to_s3(local_dir: str = None, prefix: str = '', pattern: str = '*.pdf',
+                       bucket: str = None, max_workers: int = 8) -> Dict[str, List[str]]:
+    """
+    Upload matching files to S3 in parallel, skipping unchanged content.
+
+    Files larger than 8 MB use multipart transfer. Each object stores the
+    file's SHA-256 in its metadata so repeat runs skip identical uploads.
+
+    Args:
+        local_dir: Directory to upload (default: ``test_data.upload_path``)
+        prefix: Key prefix inside the bucket
+        pattern: Glob for files to upload
+        bucket: Target bucket (default: ``aws.s3_bucket``)
+        max_workers: Number of files transferred concurrently
+
+    Returns:
+        Dictionary with ``uploaded`` and ``skipped`` key lists
+    """
+    local_dir = Path(local_dir or get_config().get('test_data.upload_path'))
+    bucket = bucket or get_config().get('aws.s3_bucket')
+    max_workers = int(max_workers)
+    _s3_client(max_workers)
+
+    files = sorted(path for path in local_dir.rglob(pattern) if path.is_file())
+    keys = [prefix + path.relative_to(local_dir).as_posix() for path in files]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        changed = list(pool.map(lambda item: _upload_one(item[0], bucket, item[1]), zip(files, keys)))
+
+    result = {
+        'uploaded': [key for key, done in zip(keys, changed) if done],
+        'skipped': [key for key, done in zip(keys, changed) if not done],
+    }
+    logger.info(f"S3 upload to {bucket}: {len(result['uploaded'])} uploaded, "
+                f"{len(result['skipped'])} unchanged")
+    return result
+
+
+def download_files_from_s3(prefix: str, local_dir: str, bucket: str = None,
+                           max_workers: int = 8) -> Dict[str, List[str]]:
+    """
+    Download every object under a prefix in parallel, skipping unchanged files.
+
+    Args:
+        prefix: Key prefix to download
+        local_dir: Destination directory (keys are made relative to the prefix)
+        bucket: Source bucket (default: ``aws.s3_bucket``)
+        max_workers: Number of objects transferred concurrently
+
+    Returns:
+        Dictionary with ``downloaded`` and ``skipped`` key lists
+    """
+    bucket = bucket or get_config().get('aws.s3_bucket')
+    max_workers = int(max_workers)
+    client = _s3_client(max_workers)
+
+    keys = []
+    for page in client.get_paginator('list_objects_v2').paginate(Bucket=bucket, Prefix=prefix):
+        keys.extend(item['Key'] for item in page.get('Contents', []) if not item['Key'].endswith('/'))
+    paths = [Path(local_dir) / key[len(prefix):].lstrip('/') for key in keys]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        changed = list(pool.map(lambda item: _download_one(bucket, item[0], item[1]), zip(keys, paths)))
+
+    result = {
+        'downloaded': [key for key, done in zip(keys, changed) if done],
+        'skipped': [key for key, done in zip(keys, changed) if not done],
+    }
+    logger.info(f"S3 download from {bucket}: {len(result['downloaded'])} downloaded, "
+                f"{len(result['skipped'])} unchanged")
+    return result
+
+16. libraries/database_helper.py
+python"""
+Database operations.
+
+Connections are pooled per process (one pool per pabot worker) and reused
+across suites. Queries use ``%s`` placeholders for every driver. Set
+``database.driver: sqlite`` and ``database.name: <file>`` to run the same
+keywords offline against a local SQLite stand-in.
+
+Block/compound validation reads a MITO project database (``MITO.db``)
+directly, read-only, and computes the expected counts of every diagram with
+one set-based query instead of one ``functionmappinginfo`` lookup per variant.
+Project databases are shared per process through ``ProjectDatabase``:
+opened read-only and memory-mapped (immutable unless the database still has
+a write-ahead log), with temporary indexed copies of the looked-up tables
+and memoized query results.
+"""
+
+import hashlib
+import html
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from robot.api import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.config_manager import get_config  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'close_database_connections',
+    'execute_many',
+    'execute_sql',
+    'get_database_pool_stats',
+    'get_expected_block_counts',
+    'get_project_db_stats',
+    'query_columns',
+    'query_project_db',
+    'query_rows',
+    'query_value',
+    'verify_block_counts',
+]
+
+_PLACEHOLDER = re.compile(r'%s')
+# Statements PostgreSQL accepts in PREPARE (a WITH prefix leads into one of them)
+_PREPARABLE = re.compile(r'\s*\(*\s*(SELECT|INSERT|UPDATE|DELETE|MERGE|VALUES|WITH)\b', re.IGNORECASE)
+
+# Temporary covering indexes for MITO.db lookups: table -> indexed columns.
+# SQLite cannot index a read-only main table from the temp schema, so the
+# table is copied into temp (which shadows it for unqualified names) first.
+PROJECT_INDEXES = {
+    'diagram_blocks': ('diagram_name', 'block'),
+    'diagram_parameter': ('diagram_name', 'variant', 'block'),
+    'functionmappinginfo': ('Variant', 'generation_type'),
+}
+PROJECT_MMAP_BYTES = 256 * 1024 * 1024
+
+# Expected counts for every diagram in one pass. A distinct (block, variant) pair
+# with a _CC variant is a compound when functionmappinginfo maps that Variant to
+# a 'Compound Component' (the rule of BlockValidator.verifyBlockCounts). SQLite
+# builds an automatic index for the Variant join, so each lookup is a seek.
+BLOCK_COUNTS_SQL = """
+    WITH compound_variants AS (
+        SELECT DISTINCT Variant FROM functionmappinginfo WHERE generation_type = 'Compound Component'
+    )
+    SELECT diagram_name, SUM(blocks), SUM(compounds) FROM (
+        SELECT diagram_name, COUNT(*) AS blocks, 0 AS compounds FROM diagram_blocks GROUP BY diagram_name
+        UNION ALL
+        SELECT p.diagram_name, 0, COUNT(*)
+        FROM (SELECT DISTINCT diagram_name, block, variant FROM diagram_parameter
+              WHERE variant LIKE '%_CC') AS p
+        JOIN compound_variants AS v ON v.Variant = p.variant
+        GROUP BY p.diagram_name
+    )
+    GROUP BY diagram_name
+"""
+
+
+class PooledConnection:
+    """A driver connection plus its per-connection prepared statement cache."""
+
+    def __init__(self, raw, driver: str):
+        self.raw = raw
+        self.driver = driver
+        self.checked_at = time.monotonic()
+        self._prepared: Dict[str, str] = {}
+
+    def execute(self, cursor, sql: str, params: Sequence[Any] = ()):
+        """Execute ``sql`` (``%s`` placeholders), preparing queries and DML once per connection."""
+        if self.driver == 'sqlite':
+            # sqlite3 keeps its own compiled-statement cache (cached_statements).
+            return cursor.execute(_PLACEHOLDER.sub('?', sql), params)
+        if self.driver == 'postgresql' and _PREPARABLE.match(sql):
+            name = self._prepared.get(sql)
+            if name is None:
+                name = f"stmt_{len(self._prepared)}"
+                counter = iter(range(1, sql.count('%s') + 1))
+                cursor.execute(f"PREPARE {name} AS " + _PLACEHOLDER.sub(lambda _: f"${next(counter)}", sql))
+                self._prepared[sql] = name
+            if params:
+                return cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+            return cursor.execute(f"EXECUTE {name}")
+        return cursor.execute(sql, params)
+
+    def executemany(self, cursor, sql: str, rows: Sequence[Sequence[Any]]):
+        if self.driver == 'sqlite':
+            sql = _PLACEHOLDER.sub('?', sql)
+        return cursor.executemany(sql, rows)
+
+    def is_healthy(self) -> bool:
+        try:
+            cursor = self.raw.cursor()
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+            cursor.close()
+        except Exception:
+            return False
+        self.checked_at = time.monotonic()
+        return True
+
+    def close(self):
+        try:
+            self.raw.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of database connections with idle health checks.
+
+    Idle connections are pinged with ``SELECT 1`` before reuse if they have
+    not been checked for ``health_check_interval`` seconds; broken ones are
+    replaced transparently.
+    """
+
+    def __init__(self, connect: Callable[[], Any], driver: str, max_size: int = 4,
+                 health_check_interval: float = 30.0):
+        self.driver = driver
+        self.max_size = max_size
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._idle = deque()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.stats = {'connects': 0, 'reuses': 0, 'health_failures': 0}
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; commits on success, rolls back on error."""
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+            conn.raw.commit()
+        except Exception:
+            if conn is not None:
+                try:
+                    conn.raw.rollback()
+                except Exception:
+                    conn.close()
+                    conn = None
+            raise
+        finally:
+            if conn is not None:
+                with self._lock:
+                    self._idle.append(conn)
+            self._slots.release()
+
+    def _checkout(self) -> PooledConnection:
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self.stats['connects'] += 1
+                return PooledConnection(self._connect(), self.driver)
+            stale = time.monotonic() - conn.checked_at > self.health_check_interval
+            if not stale or conn.is_healthy():
+                self.stats['reuses'] += 1
+                return conn
+            self.stats['health_failures'] += 1
+            conn.close()
+
+    def close(self):
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
+
+
+def _connector() -> Tuple[Callable[[], Any], str]:
+    """Build a connect callable for the configured ``database`` section."""
+    config = get_config()
+    driver = config.get('database.driver', 'postgresql')
+    if driver == 'sqlite':
+        path = config.get('database.name')
+        return (lambda: sqlite3.connect(path, check_same_thread=False, cached_statements=256)), driver
+
+    options = {
+        'host': config.get('database.host'),
+        'port': int(config.get('database.port')),
+        'user': config.get('database.username'),
+        'password': config.get('database.password'),
+    }
+    if driver == 'postgresql':
+        import psycopg2
+
+        return (lambda: psycopg2.connect(dbname=config.get('database.name'), **options)), driver
+    if driver == 'mysql':
+        import pymysql
+
+        return (lambda: pymysql.connect(database=config.get('database.name'), **options)), driver
+    raise ValueError(f"Unsupported database driver: {driver}")
+
+
+# Created by the first query
+_pool = None
+
+
+def _get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        connect, driver = _connector()
+        _pool = ConnectionPool(connect, driver, int(get_config().get('database.pool_size', 4)))
+    return _pool
+
+
+def query_rows(sql: str, *params) -> List[tuple]:
+    """
+    Run a query and return all rows as tuples.
+
+    Args:
+        sql: Query with ``%s`` placeholders
+        params: Values bound to the placeholders
+    """
+    with _get_pool().connection() as conn:
+        cursor = conn.raw.cursor()
+        conn.execute(cursor, sql, params)
+        rows = [tuple(row) for row in cursor.fetchall()]
+        cursor.close()
+    return rows
+
+
+def query_columns(sql: str, *params) -> Dict[str, list]:
+    """Run a query and return column name -> list of values (column-major)."""
+    with _get_pool().connection() as conn:
+        cursor = conn.raw.cursor()
+        conn.execute(cursor, sql, params)
+        names = [column[0] for column in cursor.description]
+        rows = cursor.fetchall()
+        cursor.close()
+    return {name: list(values) for name, values in zip(names, zip(*rows))} if rows \
+        else {name: [] for name in names}
+
+
+def query_value(sql: str, *params) -> Any:
+    """Run a query and return the first column of the first row (or None)."""
+    rows = query_rows(sql, *params)
+    return rows[0][0] if rows else None
+
+
+def execute_sql(sql: str, *params) -> int:
+    """Execute a statement and return the affected row count."""
+    with _get_pool().connection() as conn:
+        cursor = conn.raw.cursor()
+        conn.execute(cursor, sql, params)
+        count = cursor.rowcount
+        cursor.close()
+    return count
+
+
+def execute_many(sql: str, rows: Sequence[Sequence[Any]]) -> int:
+    """Execute a statement once per parameter row in a single round of batching."""
+    with _get_pool().connection() as conn:
+        cursor = conn.raw.cursor()
+        conn.executemany(cursor, sql, rows)
+        count = cursor.rowcount
+        cursor.close()
+    return count
+
+
+def get_database_pool_stats() -> Dict[str, int]:
+    """Return (and log) connect/reuse/health-check counters for this worker."""
+    stats = dict(_pool.stats) if _pool else {}
+    logger.info(f"Database pool stats: {stats}")
+    return stats
+
+
+def close_database_connections():
+    """Close all pooled connections, e.g. in a worker teardown."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+class ProjectDatabase:
+    """
+    Shared read-only view of a MITO project database for one run.
+
+    The file is opened with ``immutable=1`` (no locking or change detection)
+    and read through a memory map. A database in WAL mode whose ``-wal``
+    file still exists is opened with plain ``mode=ro`` instead, since an
+    immutable connection would ignore the log and read stale pages. Tables in ``PROJECT_INDEXES`` that have
+    no index on their lookup column get an indexed temporary copy, and
+    identical queries are answered from memory after the first execution.
+    """
+
+    def __init__(self, db_path: str):
+        self.path = db_path
+        uri = Path(db_path).resolve().as_uri()
+        self.immutable = True
+        if Path(f"{db_path}-wal").exists():
+            self.raw = self._connect(f"{uri}?mode=ro")
+            if self.raw.execute('PRAGMA journal_mode').fetchone()[0].lower() == 'wal':
+                self.immutable = False
+            else:
+                self.raw.close()
+        if self.immutable:
+            self.raw = self._connect(f"{uri}?mode=ro&immutable=1")
+        self.raw.execute(f"PRAGMA mmap_size = {PROJECT_MMAP_BYTES}")
+        self._memo: Dict[Tuple[str, tuple], List[tuple]] = {}
+        self._lock = threading.Lock()
+        self.stats = {'queries': 0, 'memo_hits': 0, 'temp_indexes': 0}
+        self._create_temp_indexes()
+
+    @staticmethod
+    def _connect(uri: str) -> sqlite3.Connection:
+        return sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+
+    def _create_temp_indexes(self):
+        tables = {row[0] for row in self.raw.execute("SELECT name FROM main.sqlite_master WHERE type = 'table'")}
+        for table, columns in PROJECT_INDEXES.items():
+            if table not in tables:
+                continue
+            indexed = {info[2] for index in self.raw.execute(f'PRAGMA main.index_list("{table}")')
+                       for info in self.raw.execute(f'PRAGMA main.index_info("{index[1]}")') if info[0] == 0}
+            if columns[0] in indexed:
+                continue
+            self.raw.execute(f'CREATE TEMP TABLE "{table}" AS SELECT * FROM main."{table}"')
+            self.raw.execute(f'CREATE INDEX temp."ix_{table}" ON "{table}" ({", ".join(columns)})')
+            self.stats['temp_indexes'] += 1
+        self.raw.execute('ANALYZE temp')
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Run a read query (``%s`` placeholders), memoized for the lifetime of this object."""
+        key = (sql, tuple(params))
+        with self._lock:
+            self.stats['queries'] += 1
+            rows = self._memo.get(key)
+            if rows is None:
+                rows = self.raw.execute(_PLACEHOLDER.sub('?', sql), key[1]).fetchall()
+                self._memo[key] = rows
+            else:
+                self.stats['memo_hits'] += 1
+        return list(rows)
+
+    def row_digests(self, table: str, key_column: str = None) -> Dict[Any, str]:
+        """
+        Content hash of a table's rows, per value of ``key_column``.
+
+        Without ``key_column`` the whole table gets one hash (key ``None``).
+        Rows are streamed in the order of all their columns, so the hash does
+        not depend on storage order, and are not memoized.
+        """
+        digests: Dict[Any, Any] = {}
+        with self._lock:
+            columns = [row[1] for row in self.raw.execute(f'PRAGMA table_info("{table}")')]
+            order = ', '.join(str(position) for position in range(1, len(columns) + 1))
+            if key_column:
+                order = f'{columns.index(key_column) + 1}, {order}'
+            cursor = self.raw.execute(f'SELECT * FROM "{table}" ORDER BY {order}')
+            position = [column[0] for column in cursor.description].index(key_column) if key_column else None
+            for row in cursor:
+                key = row[position] if key_column else None
+                digest = digests.get(key)
+                if digest is None:
+                    digest = digests[key] = hashlib.sha256()
+                digest.update(repr(row).encode())
+        return {key: digest.hexdigest() for key, digest in digests.items()}
+
+    def close(self):
+        self.raw.close()
+
+
+# Resolved path -> (change stamp, ProjectDatabase)
+_projects: Dict[str, tuple] = {}
+
+
+def project_db_stamp(db_path: str) -> tuple:
+    """Change stamp of a project database: mtime and size of the file and of its ``-wal`` log, if any."""
+    stamp = ()
+    for path in (Path(db_path), Path(f"{db_path}-wal")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stamp += (None, None)
+            continue
+        stamp += (stat.st_mtime_ns, stat.st_size)
+    return stamp
+
+
+def open_project_db(db_path: str) -> ProjectDatabase:
+    """Shared ProjectDatabase for a path, reopened when the file or its ``-wal`` log changes."""
+    path = Path(db_path)
+    if not path.exists():
+        raise AssertionError(f"Project database {db_path} not found")
+    key = project_db_stamp(db_path)
+    cached = _projects.get(str(path.resolve()))
+    if cached and cached[0] == key:
+        return cached[1]
+    if cached:
+        cached[1].close()
+    project = ProjectDatabase(db_path)
+    _projects[str(path.resolve())] = (key, project)
+    return project
+
+
+def query_project_db(db_path: str, sql: str, *params) -> List[tuple]:
+    """
+    Run a read query against a MITO project database through the shared layer.
+
+    Args:
+        db_path: Path of the project's ``MITO.db``
+        sql: Query with ``%s`` placeholders
+        params: Values bound to the placeholders
+    """
+    return open_project_db(db_path).query(sql, params)
+
+
+def get_project_db_stats(db_path: str) -> Dict[str, int]:
+    """Return (and log) query, memo-hit and temporary-index counters for a project database."""
+    stats = dict(open_project_db(db_path).stats)
+    logger.info(f"Project database stats for {db_path}: {stats}")
+    return stats
+
+
+def get_expected_block_counts(db_path: str) -> Dict[str, Dict[str, int]]:
+    """
+    Compute the expected block and compound counts of every diagram in a MITO.db.
+
+    Args:
+        db_path: Path of the project's ``MITO.db``
+
+    Returns:
+        Dictionary of diagram name to ``{'blocks': n, 'compounds': m}``
+    """
+    rows = open_project_db(db_path).query(BLOCK_COUNTS_SQL)
+    return {name: {'blocks': blocks, 'compounds': compounds} for name, blocks, compounds in rows}
+
+
+def verify_block_counts(db_path: str, actual_counts: Dict[str, Dict[str, int]],
+                        diagrams: Sequence[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare ``<afi>``/``<compound>`` counts from the diagram XML against MITO.db.
+
+    For each diagram, ``afi + compound`` must equal its ``diagram_blocks``
+    rows and ``compound`` must equal its compound blocks. The per-diagram
+    expected-versus-actual table is logged; any mismatch fails the keyword.
+
+    Args:
+        db_path: Path of the project's ``MITO.db``
+        actual_counts: Diagram name to ``{'afi': a, 'compound': c}`` from the XML
+        diagrams: Diagram names to check (default: every diagram in the database)
+
+    Returns:
+        Dictionary of diagram name to its expected and actual counts and ``ok``
+    """
+    expected = get_expected_block_counts(db_path)
+    names = list(diagrams) if diagrams else sorted(expected.keys() | actual_counts.keys())
+    results = {}
+    for name in names:
+        want = expected.get(name, {'blocks': 0, 'compounds': 0})
+        got = actual_counts.get(name)
+        actual_total = got['afi'] + got['compound'] if got else None
+        actual_compounds = got['compound'] if got else None
+        results[name] = {
+            'expected_blocks': want['blocks'], 'actual_blocks': actual_total,
+            'expected_compounds': want['compounds'], 'actual_compounds': actual_compounds,
+            'ok': actual_total == want['blocks'] and actual_compounds == want['compounds'],
+        }
+
+    rows = ''.join(
+        f"<tr><td>{html.escape(str(name))}</td><td>{r['expected_blocks']}</td><td>{r['actual_blocks']}</td>"
+        f"<td>{r['expected_compounds']}</td><td>{r['actual_compounds']}</td>"
+        f"<td>{'PASS' if r['ok'] else 'FAIL'}</td></tr>"
+        for name, r in results.items()
+    )
+    logger.info('<table border="1"><tr><th>Diagram</th><th>DB blocks</th><th>XML afi+compound</th>'
+                f'<th>DB compounds</th><th>XML compound</th><th>Result</th></tr>{rows}</table>', html=True)
+
+    failed = [name for name, r in results.items() if not r['ok']]
+    if failed:
+        raise AssertionError(f"Block counts differ from {db_path} for {len(failed)} of {len(results)} "
+                             f"diagram(s): {', '.join(failed[:20])}")
+    return results
+
+17. libraries/pdf_helper.py
+python"""
+PDF validation and operations.
+
+Validation works on a memory-mapped file: PyPDF2 only reads the trailer,
+xref and page tree it needs, so page count, size and encryption are checked
+without decoding page content. Rasterization is done per requested page.
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PyPDF2 import PdfReader
+from PyPDF2.errors import PdfReadError
+from robot.api import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from config.config_manager import get_config  # noqa: E402
+from fixture_helper import file_sha256  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'compare_pdf_to_expected',
+    'get_pdf_page_count',
+    'render_pdf_pages',
+    'validate_pdf',
+]
+
+MB = 1024 * 1024
+EXPECTED_DIR = 'test_data/expected_outputs'
+RENDER_CACHE_DIR = '.cache/rendered'
+
+
+@contextmanager
+def _mapped_reader(pdf_path: str):
+    """Open a PdfReader over a read-only memory map of the file."""
+    with open(pdf_path, 'rb') as file:
+        # mmap cannot map an empty file
+        if os.fstat(file.fileno()).st_size == 0:
+            raise AssertionError(f"{pdf_path} is not a PDF (empty file)")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if not data[:1024].lstrip().startswith(b'%PDF-'):
+                raise AssertionError(f"{pdf_path} is not a PDF (missing %PDF- header)")
+            yield data, PdfReader(data, strict=False)
+
+
+def _parse_pages(pages: str, page_count: int) -> List[int]:
+    """Parse a ``1,3-5`` style page spec into sorted 1-based page numbers."""
+    selected = set()
+    for part in str(pages).split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        start, end = int(first), int(last or first)
+        if start < 1 or end > page_count or start > end:
+            raise ValueError(f"Page range '{part}' is outside 1-{page_count}")
+        selected.update(range(start, end + 1))
+    return sorted(selected)
+
+
+def _page_ranges(pages: List[int]):
+    """Group sorted page numbers into contiguous (first, last) runs."""
+    start = previous = pages[0]
+    for page in pages[1:]:
+        if page != previous + 1:
+            yield start, previous
+            start = page
+        previous = page
+    yield start, previous
+
+
+def validate_pdf(pdf_path: str, max_pages: int = None, max_size_mb: float = None,
+                 allow_encrypted: bool = False) -> Dict[str, Any]:
+    """
+    Validate a PDF's size, page count and encryption without loading its content.
+
+    Args:
+        pdf_path: PDF file to validate
+        max_pages: Page limit (default: ``test_data.max_pages``)
+        max_size_mb: Size limit in MB (default: ``test_data.max_file_size_mb``)
+        allow_encrypted: Accept encrypted documents
+
+    Returns:
+        Dictionary with ``size_mb``, ``page_count``, ``encrypted`` and ``version``
+    """
+    config = get_config()
+    max_pages = int(max_pages or config.get('test_data.max_pages', 150))
+    max_size_mb = float(max_size_mb or config.get('test_data.max_file_size_mb', 50))
+
+    size_mb = Path(pdf_path).stat().st_size / MB
+    if size_mb > max_size_mb:
+        raise AssertionError(f"{pdf_path} is {size_mb:.1f} MB, limit is {max_size_mb} MB")
+
+    try:
+        with _mapped_reader(pdf_path) as (data, reader):
+            version = data[:16].split(b'\n')[0].strip().decode('latin-1', 'replace')
+            encrypted = reader.is_encrypted
+            if encrypted and not allow_encrypted:
+                raise AssertionError(f"{pdf_path} is encrypted")
+            if encrypted:
+                reader.decrypt('')
+            page_count = len(reader.pages)
+    except PdfReadError as error:
+        raise AssertionError(f"{pdf_path} is not a readable PDF: {error}") from error
+
+    if page_count > max_pages:
+        raise AssertionError(f"{pdf_path} has {page_count} pages, limit is {max_pages}")
+
+    info = {'size_mb': round(size_mb, 2), 'page_count': page_count,
+            'encrypted': encrypted, 'version': version}
+    logger.info(f"PDF {Path(pdf_path).name} valid: {info}")
+    return info
+
+
+def get_pdf_page_count(pdf_path: str) -> int:
+    """Return the page count from the page tree, without parsing page content."""
+    with _mapped_reader(pdf_path) as (_, reader):
+        if reader.is_encrypted:
+            reader.decrypt('')
+        return len(reader.pages)
+
+
+def render_pdf_pages(pdf_path: str, pages: str = '1', dpi: int = 100,
+                     output_dir: str = None) -> List[str]:
+    """
+    Rasterize only the requested pages to PNG files.
+
+    Each contiguous run of pages is rendered in one ``pdf2image`` call and
+    written straight to disk, so memory holds one run at most.
+
+    Args:
+        pdf_path: Source PDF
+        pages: Page spec such as ``1``, ``2,5`` or ``3-6``
+        dpi: Render resolution
+        output_dir: Where to write PNGs (default: next to the PDF)
+
+    Returns:
+        List of written PNG paths, in page order
+    """
+    from pdf2image import convert_from_path
+
+    source = Path(pdf_path)
+    output = Path(output_dir) if output_dir else source.parent
+    output.mkdir(parents=True, exist_ok=True)
+    selected = _parse_pages(pages, get_pdf_page_count(pdf_path))
+
+    written = []
+    for first, last in _page_ranges(selected):
+        images = convert_from_path(str(source), dpi=int(dpi), first_page=first, last_page=last)
+        for page, image in zip(range(first, last + 1), images):
+            target = output / f"{source.stem}_p{page}_{dpi}dpi.png"
+            image.save(target)
+            image.close()
+            written.append(str(target))
+    return written
+
+
+def _render_page(pdf_path: str, page: int, dpi: int):
+    """Render a single page to a Pillow image."""
+    from pdf2image import convert_from_path
+
+    return convert_from_path(pdf_path, dpi=dpi, first_page=page, last_page=page)[0]
+
+
+def _expected_page(expected_pdf: str, expected_hash: str, page: int, dpi: int, cache_dir: str):
+    """Rendered expected page, from the cache keyed by file hash and DPI."""
+    from PIL import Image
+
+    cached = Path(cache_dir) / f"{expected_hash}_{dpi}dpi" / f"p{page}.png"
+    if cached.exists():
+        return Image.open(cached)
+    image = _render_page(expected_pdf, page, dpi)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cached.parent, suffix='.png')
+    with os.fdopen(fd, 'wb') as file:
+        image.save(file, format='PNG')
+    os.replace(tmp_path, cached)
+    return image
+
+
+def _compare_page(task) -> float:
+    """
+    Diff one page in a worker process.
+
+    Returns the fraction of compared pixels whose grayscale difference exceeds
+    ``tolerance``; pixels that are black in the mask are ignored.
+    """
+    import numpy as np
+    from PIL import Image
+
+    actual_pdf, expected_pdf, expected_hash, page, dpi, tolerance, mask_path, cache_dir = task
+    actual = np.asarray(_render_page(actual_pdf, page, dpi).convert('L'), dtype=np.int16)
+    expected = np.asarray(
+        _expected_page(expected_pdf, expected_hash, page, dpi, cache_dir).convert('L'), dtype=np.int16
+    )
+    if actual.shape != expected.shape:
+        return 1.0
+
+    differs = np.abs(actual - expected) > tolerance
+    if mask_path:
+        mask = np.asarray(Image.open(mask_path).convert('L').resize(actual.shape[::-1])) > 127
+        differs &= mask
+        compared = int(mask.sum())
+    else:
+        compared = differs.size
+    return float(differs.sum()) / compared if compared else 0.0
+
+
+def compare_pdf_to_expected(actual_pdf: str, expected_pdf: str = None, pages: str = 'all',
+                            dpi: int = 100, tolerance: int = 0, max_diff: float = 0.001,
+                            mask: Optional[str] = None, max_workers: int = None) -> Dict[int, float]:
+    """
+    Compare rendered pages of a PDF against its expected output, in parallel.
+
+    Pages are rendered and diffed in a process pool, one page per task.
+    Expected pages are rendered once and cached under ``.cache/rendered``
+    keyed by the expected file's SHA-256 and DPI.
+
+    Args:
+        actual_pdf: PDF produced by the application
+        expected_pdf: Reference PDF (default: same file name in ``test_data/expected_outputs``)
+        pages: ``all`` or a page spec such as ``1,3-5``
+        dpi: Render resolution
+        tolerance: Grayscale difference (0-255) below which pixels count as equal
+        max_diff: Highest allowed fraction of differing pixels per page
+        mask: Optional PNG; black areas are excluded from the comparison
+        max_workers: Process count (default: CPU count)
+
+    Returns:
+        Dictionary of page number to diff score (fraction of differing pixels)
+    """
+    expected_pdf = expected_pdf or str(Path(EXPECTED_DIR) / Path(actual_pdf).name)
+    page_count = get_pdf_page_count(actual_pdf)
+    expected_count = get_pdf_page_count(expected_pdf)
+    if page_count != expected_count:
+        raise AssertionError(f"Page count differs: {page_count} vs expected {expected_count}")
+
+    selected = list(range(1, page_count + 1)) if pages == 'all' else _parse_pages(pages, page_count)
+    expected_hash = file_sha256(expected_pdf)
+    tasks = [(actual_pdf, expected_pdf, expected_hash, page, int(dpi), int(tolerance), mask,
+              RENDER_CACHE_DIR) for page in selected]
+    with ProcessPoolExecutor(max_workers=int(max_workers) if max_workers else None) as pool:
+        scores = dict(zip(selected, pool.map(_compare_page, tasks)))
+
+    logger.info(f"Page diff scores for {Path(actual_pdf).name}: {scores}")
+    failed = {page: score for page, score in scores.items() if score > float(max_diff)}
+    if failed:
+        raise AssertionError(f"Pages differ from {expected_pdf} beyond {max_diff}: {failed}")
+    return scores
+
+18. utils/build_fixture_index.py
+python"""Build the fixture PDF fingerprint index for test_data/.
+
+The index records each fixture's SHA-256, size, page count and validity
+class (``valid``/``invalid``, from its folder). Unchanged files (same size
+and mtime) keep their previous entry, so rebuilding is incremental.
+
+``--changed-only`` compares against a separate baseline, the index of the
+last run whose affected tests passed. ``--commit`` records the current index
+as that baseline once the tests are green, so a failed or interrupted run
+reports the same changes again next time.
+
+Usage:
+    python utils/build_fixture_index.py
+    python utils/build_fixture_index.py --changed-only --argfile results/qa/changed_tests.args
+    python utils/build_fixture_index.py --commit
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Set
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from fixture_helper import file_sha256  # noqa: E402
+
+TEST_DATA = ROOT / 'test_data'
+INDEX_FILE = TEST_DATA / 'fixture_index.json'
+BASELINE_FILE = TEST_DATA / 'fixture_index.green.json'
+FIXTURE_DIRS = {'valid_pdfs': 'valid', 'invalid_pdfs': 'invalid'}
+INDEX_VERSION = 1
+
+
+def _page_count(path: Path):
+    """Page count, or None for files PyPDF2 cannot read (expected for invalid fixtures)."""
+    try:
+        from PyPDF2 import PdfReader
+
+        with open(path, 'rb') as file:
+            return len(PdfReader(file, strict=False).pages)
+    except Exception:
+        return None
+
+
+def load_index(path: Path = INDEX_FILE) -> Dict[str, dict]:
+    """Load the fixtures of an existing index (empty if missing or outdated)."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data.get('fixtures', {}) if data.get('version') == INDEX_VERSION else {}
+
+
+def build_index(previous: Dict[str, dict]) -> Dict[str, dict]:
+    """Fingerprint every fixture, reusing entries whose size and mtime are unchanged."""
+    fixtures = {}
+    for folder, validity in FIXTURE_DIRS.items():
+        for path in sorted((TEST_DATA / folder).rglob('*')):
+            if not path.is_file():
+                continue
+            key = path.relative_to(TEST_DATA).as_posix()
+            stat = path.stat()
+            entry = previous.get(key)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                fixtures[key] = entry
+                continue
+            fixtures[key] = {
+                'name': path.name,
+                'sha256': file_sha256(path),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'page_count': _page_count(path),
+                'validity': validity,
+            }
+    return fixtures
+
+
+def changed_fixtures(previous: Dict[str, dict], current: Dict[str, dict]) -> Set[str]:
+    """Fixtures that were added, removed or whose content hash changed."""
+    return {
+        key for key in previous.keys() | current.keys()
+        if (previous.get(key) or {}).get('sha256') != (current.get(key) or {}).get('sha256')
+    }
+
+
+def tests_using(fixture_names: Set[str], tests_dir: Path = ROOT / 'tests') -> List[str]:
+    """
+    Names of test cases that reference any of the given fixture file names.
+
+    A reference in a suite's *** Variables *** or *** Settings *** section
+    selects every test in that suite.
+    """
+    if not fixture_names:
+        return []
+    pattern = re.compile('|'.join(re.escape(name) for name in sorted(fixture_names)))
+    selected = []
+    for suite in sorted(tests_dir.rglob('*.robot')):
+        section, tests, current_test, suite_wide = None, {}, None, False
+        for line in suite.read_text(encoding='utf-8').splitlines():
+            if line.startswith('***'):
+                section = line.strip('* ').lower()
+                current_test = None
+                continue
+            if section == 'test cases' and line and not line[0].isspace() and not line.startswith('#'):
+                current_test = line.strip()
+                tests[current_test] = False
+            elif pattern.search(line):
+                if section == 'test cases' and current_test:
+                    tests[current_test] = True
+                elif section in ('variables', 'settings'):
+                    suite_wide = True
+        selected.extend(name for name, uses in tests.items() if uses or suite_wide)
+    return selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the fixture PDF fingerprint index')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Report tests whose fixtures changed since the last green baseline')
+    parser.add_argument('--argfile', default=None,
+                        help='With --changed-only, write a robot/pabot --argumentfile selecting those tests')
+    parser.add_argument('--commit', action='store_true',
+                        help='Record the current index as the last green baseline (after the tests passed)')
+    args = parser.parse_args()
+
+    if args.commit:
+        current = load_index()
+        BASELINE_FILE.write_text(json.dumps({'version': INDEX_VERSION, 'fixtures': current}, indent=2))
+        print(f"✅ Recorded {len(current)} fixtures as the last green baseline")
+        return
+
+    previous = load_index()
+    current = build_index(previous)
+    INDEX_FILE.write_text(json.dumps({'version': INDEX_VERSION, 'fixtures': current}, indent=2))
+    print(f"📇 Indexed {len(current)} fixtures ({len(current.keys() - previous.keys())} new)")
+
+    if args.changed_only:
+        changed = changed_fixtures(load_index(BASELINE_FILE), current)
+        names = {Path(key).name for key in changed}
+        tests = tests_using(names)
+        print(f"🔁 {len(changed)} changed fixture(s), {len(tests)} affected test(s)")
+        for name in tests:
+            print(f"  - {name}")
+        if args.argfile:
+            Path(args.argfile).parent.mkdir(parents=True, exist_ok=True)
+            Path(args.argfile).write_text(''.join(f"--test {name}\n" for name in tests))
+
+
+if __name__ == '__main__':
+    main()
+
+19. libraries/fixture_helper.py
+python"""
+Fixture PDF selection from the fingerprint index.
+
+Reads ``test_data/fixture_index.json`` (built by
+``utils/build_fixture_index.py``) once per process, so keywords pick fixtures
+by name or class without scanning folders or opening PDFs. ``file_sha256``
+computes the fingerprint hash and is shared with the index builder and the
+PDF and S3 helpers.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'get_fixture_info',
+    'get_fixture_path',
+    'get_fixtures_by_class',
+    'select_fixture',
+]
+
+TEST_DATA = Path(__file__).resolve().parents[1] / 'test_data'
+INDEX_FILE = TEST_DATA / 'fixture_index.json'
+
+HASH_CHUNK = 1024 * 1024
+
+# Index for this process: by relative path, by file name, and by validity class
+_by_key = None
+_by_name = None
+_by_class = None
+
+
+def file_sha256(path) -> str:
+    """SHA-256 hex digest of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load():
+    global _by_key, _by_name, _by_class
+    if _by_key is not None:
+        return
+    if not INDEX_FILE.exists():
+        raise RuntimeError(f"{INDEX_FILE} not found, run: python utils/build_fixture_index.py")
+    fixtures = json.loads(INDEX_FILE.read_text())['fixtures']
+    _by_key, _by_name, _by_class = {}, {}, {}
+    for key, entry in fixtures.items():
+        entry = dict(entry, key=key, path=str(TEST_DATA / key))
+        _by_key[key] = entry
+        _by_name.setdefault(entry['name'], entry)
+        _by_class.setdefault(entry['validity'], []).append(entry)
+
+
+def get_fixture_info(name: str) -> Dict:
+    """
+    Return the index entry for a fixture.
+
+    Args:
+        name: File name (``sample_drawing.pdf``) or path relative to test_data
+            (``valid_pdfs/sample_drawing.pdf``)
+
+    Returns:
+        Dictionary with ``path``, ``sha256``, ``size``, ``page_count`` and ``validity``
+    """
+    _load()
+    entry = _by_key.get(name) or _by_name.get(name)
+    if entry is None:
+        raise AssertionError(f"Fixture '{name}' is not in {INDEX_FILE.name}")
+    return entry
+
+
+def get_fixture_path(name: str) -> str:
+    """Return the absolute path of a fixture."""
+    return get_fixture_info(name)['path']
+
+
+def get_fixtures_by_class(validity: str = 'valid') -> List[str]:
+    """Return the paths of all fixtures of a validity class (``valid``/``invalid``)."""
+    _load()
+    return [entry['path'] for entry in _by_class.get(validity, [])]
+
+
+def select_fixture(validity: str = 'valid', min_pages: int = None, max_pages: int = None) -> str:
+    """Return the path of the first fixture of a class within an optional page range."""
+    _load()
+    for entry in _by_class.get(validity, []):
+        pages = entry['page_count']
+        if min_pages is not None and (pages is None or pages < int(min_pages)):
+            continue
+        if max_pages is not None and (pages is None or pages > int(max_pages)):
+            continue
+        return entry['path']
+    raise AssertionError(f"No {validity} fixture with pages in [{min_pages}, {max_pages}]")
+
+20. utils/pabot_scheduler.py
+python"""Duration-aware pabot scheduler.
+
+Reads suite durations from previous ``output.xml`` files, assigns suites to
+workers longest-processing-time-first, and writes a pabot ordering file with
+one ``{ }`` group per worker. Scheduling is per suite, so a suite's tests
+stay together, in order, with a single Suite Setup. Suites without history
+are estimated with the median known duration. Pass the same ``--include``
+and ``--exclude`` tags as the pabot run so only the suites it runs are
+scheduled.
+
+Usage:
+    python utils/pabot_scheduler.py --history ".cache/timings/*.xml" --exclude slow \\
+        --processes 4 --output results/qa/ordering.txt tests/functional/
+    pabot --processes 4 --ordering results/qa/ordering.txt --exclude slow tests/functional/
+"""
+
+import argparse
+import glob
+import heapq
+import statistics
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from report_generator import status_elapsed  # noqa: E402
+
+DEFAULT_DURATION = 60.0
+
+
+def read_durations(output_xml: str) -> Dict[str, float]:
+    """Map long names of suites holding tests to durations (setup and teardown included), streaming output.xml."""
+    durations = {}
+    suites = []
+    has_tests = []
+    for event, elem in ET.iterparse(output_xml, events=('start', 'end')):
+        if elem.tag == 'suite':
+            if event == 'start':
+                suites.append(elem.get('name'))
+                has_tests.append(False)
+                continue
+            status = elem.find('status')
+            if has_tests.pop() and status is not None:
+                durations['.'.join(suites)] = status_elapsed(status)
+            suites.pop()
+            elem.clear()
+        elif elem.tag == 'test' and event == 'end':
+            has_tests[-1] = True
+            elem.clear()
+    return durations
+
+
+def historical_durations(paths: List[str]) -> Dict[str, float]:
+    """Average each suite's duration over all history files."""
+    samples: Dict[str, List[float]] = {}
+    for path in paths:
+        for name, seconds in read_durations(path).items():
+            samples.setdefault(name, []).append(seconds)
+    return {name: statistics.fmean(values) for name, values in samples.items()}
+
+
+def discover_suites(sources: List[str], include: List[str] = None, exclude: List[str] = None) -> List[str]:
+    """Long names of the suites holding tests selected by the tags, as pabot will see them."""
+    from robot.api import TestSuiteBuilder
+
+    suite = TestSuiteBuilder().build(*sources)
+    suite.filter(included_tags=include or None, excluded_tags=exclude or None)
+    suites, pending = [], [suite]
+    while pending:
+        current = pending.pop()
+        if current.tests:
+            suites.append(current.longname)
+        pending.extend(reversed(current.suites))
+    return suites
+
+
+def schedule(suites: List[str], durations: Dict[str, float],
+             processes: int) -> List[Tuple[float, List[str]]]:
+    """
+    Longest-processing-time-first bin packing.
+
+    Returns:
+        One (estimated seconds, suite names) bin per worker
+    """
+    known = [durations[suite] for suite in suites if suite in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    estimates = {suite: durations.get(suite, fallback) for suite in suites}
+
+    bins = [(0.0, index, []) for index in range(processes)]
+    heapq.heapify(bins)
+    for suite in sorted(suites, key=lambda name: estimates[name], reverse=True):
+        load, index, members = heapq.heappop(bins)
+        members.append(suite)
+        heapq.heappush(bins, (load + estimates[suite], index, members))
+    return sorted(((load, members) for load, _, members in bins), reverse=True)
+
+
+def write_ordering(bins: List[Tuple[float, List[str]]], output: str):
+    """Write a pabot --ordering file with one sequential group of suites per worker."""
+    lines = []
+    for _, members in bins:
+        if not members:
+            continue
+        lines.append('{')
+        lines.extend(f"--suite {name}" for name in members)
+        lines.append('}')
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    Path(output).write_text('\n'.join(lines) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Duration-aware pabot scheduler')
+    parser.add_argument('sources', nargs='+', help='Test suite files or directories')
+    parser.add_argument('--history', action='append', default=[],
+                        help='output.xml file or glob with past timings (repeatable)')
+    parser.add_argument('--include', action='append', default=[],
+                        help='Tag of tests to include, as passed to pabot (repeatable)')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='Tag of tests to exclude, as passed to pabot (repeatable)')
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--output', default='results/ordering.txt')
+    args = parser.parse_args()
+
+    history = sorted({path for pattern in args.history for path in glob.glob(pattern)})
+    durations = historical_durations(history)
+    suites = discover_suites(args.sources, args.include, args.exclude)
+    bins = schedule(suites, durations, args.processes)
+    write_ordering(bins, args.output)
+
+    total = sum(load for load, _ in bins)
+    makespan = bins[0][0] if bins else 0.0
+    print(f"📅 {len(suites)} suites from {len(history)} history file(s) "
+          f"({sum(suite in durations for suite in suites)} with timings)")
+    for worker, (load, members) in enumerate(bins, 1):
+        print(f"  worker {worker}: {len(members):4d} suites, ~{load:8.1f}s")
+    print(f"⏱️  Estimated wall clock {makespan:.1f}s (ideal {total / max(args.processes, 1):.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
+
+21. libraries/report_generator.py
+python"""
+Custom reporting from Robot Framework output.xml.
+
+``parse_output`` streams through output.xml with ``iterparse`` and drops each
+element as soon as it has been counted, so memory stays flat no matter how
+many keywords a run produced. Statistics are aggregated per suite, tag and
+keyword.
+
+When the run used the ``keyword_profiler`` listener, its per-worker
+``keyword_profile.json`` files are merged into a self-time table.
+
+``ResultsStore`` appends every run to a SQLite history so flaky tests and
+duration trends can be queried across runs after artifacts have expired.
+"""
+
+import html
+import json
+import math
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Robot Framework keywords exported by this library
+__all__ = ['generate_report']
+
+# Written by the keyword_profiler listener next to each (pabot worker) output.xml
+PROFILE_JSON = 'keyword_profile.json'
+
+# Elements that must survive until their parent ends (read from the parent).
+_KEEP = {'status', 'tag', 'doc', 'meta'}
+
+# Log-scale duration histogram: bucket 0 is <= 1 ms, each next bucket is 25% wider.
+HIST_BASE = 0.001
+HIST_GROWTH = 1.25
+HIST_BUCKETS = 64
+
+
+def _hist_index(seconds: float) -> int:
+    if seconds <= HIST_BASE:
+        return 0
+    return min(HIST_BUCKETS - 1, int(math.log(seconds / HIST_BASE, HIST_GROWTH)) + 1)
+
+
+def hist_percentile(histogram, percentile: float) -> float:
+    """Upper bound (seconds) of the bucket holding the given percentile."""
+    count = sum(histogram)
+    if not count:
+        return 0.0
+    target, seen = count * percentile / 100, 0
+    for index, value in enumerate(histogram):
+        seen += value
+        if seen >= target:
+            return HIST_BASE * HIST_GROWTH ** index
+    return HIST_BASE * HIST_GROWTH ** (HIST_BUCKETS - 1)
+
+
+def status_elapsed(status: ET.Element) -> float:
+    """Duration from a <status> element (Robot 7 and Robot 6 formats)."""
+    if status.get('elapsed') is not None:
+        return float(status.get('elapsed'))
+    fmt = '%Y%m%d %H:%M:%S.%f'
+    start, end = status.get('starttime'), status.get('endtime')
+    if not start or not end or 'N/A' in (start, end):
+        return 0.0
+    return (datetime.strptime(end, fmt) - datetime.strptime(start, fmt)).total_seconds()
+
+
+def _start_time(status: ET.Element) -> str:
+    return status.get('start') or status.get('starttime') or ''
+
+
+class _Bucket:
+    """Pass/fail/skip counts and durations for one aggregation key."""
+
+    __slots__ = ('passed', 'failed', 'skipped', 'total', 'max', 'histogram')
+
+    def __init__(self):
+        self.passed = self.failed = self.skipped = 0
+        self.total = self.max = 0.0
+        self.histogram = array('I', bytes(4 * HIST_BUCKETS))
+
+    def add(self, status: str, seconds: float):
+        if status == 'PASS':
+            self.passed += 1
+        elif status == 'FAIL':
+            self.failed += 1
+        else:
+            self.skipped += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.histogram[_hist_index(seconds)] += 1
+
+    def merge(self, other: '_Bucket'):
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        for index, value in enumerate(other.histogram):
+            self.histogram[index] += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        count = self.passed + self.failed + self.skipped
+        return {
+            'count': count, 'passed': self.passed, 'failed': self.failed, 'skipped': self.skipped,
+            'total_seconds': round(self.total, 3), 'max_seconds': round(self.max, 3),
+            'avg_seconds': round(self.total / count, 3) if count else 0.0,
+        }
+
+
+class RunStats:
+    """Aggregated statistics of one output.xml."""
+
+    def __init__(self):
+        self.suites: Dict[str, _Bucket] = {}
+        self.tags: Dict[str, _Bucket] = {}
+        self.keywords: Dict[str, _Bucket] = {}
+        self.keyword_names: Dict[str, str] = {}  # full name -> keyword name without its owner
+        self.tests: List[Dict[str, Any]] = []
+        self.totals = _Bucket()
+        self.start_time = ''
+        self.elapsed = 0.0
+        self.profile: Dict[str, Dict[str, float]] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        def buckets(items):
+            return {name: bucket.to_dict() for name, bucket in sorted(items.items())}
+
+        return {
+            'start_time': self.start_time,
+            'elapsed_seconds': round(self.elapsed, 3),
+            'totals': self.totals.to_dict(),
+            'suites': buckets(self.suites),
+            'tags': buckets(self.tags),
+            'keywords': buckets(self.keywords),
+            'keyword_profile': {name: {key: round(value, 6) for key, value in entry.items()}
+                                for name, entry in sorted(self.profile.items())},
+        }
+
+    def merge_profile(self, profile: Dict[str, Dict[str, float]]):
+        """Add keyword profiler totals (calls, wall and self seconds) to this run."""
+        for name, entry in profile.items():
+            merged = self.profile.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'self_seconds': 0.0})
+            for key in merged:
+                merged[key] += entry[key]
+
+    def add_test(self, suites: List[str], name: str, status: str, seconds: float,
+                 tags: List[str], start: str = ''):
+        """Count one test result in the totals, its suites and its tags."""
+        self.totals.add(status, seconds)
+        for depth in range(1, len(suites) + 1):
+            self.suites.setdefault('.'.join(suites[:depth]), _Bucket()).add(status, seconds)
+        for tag in tags:
+            self.tags.setdefault(tag, _Bucket()).add(status, seconds)
+        self.tests.append({'name': '.'.join(suites + [name]), 'suites': list(suites), 'test': name,
+                           'status': status, 'elapsed': seconds, 'tags': tags, 'start': start})
+
+    def slowest_keywords(self, top: int = 20) -> List[tuple]:
+        return sorted(self.keywords.items(), key=lambda item: item[1].total, reverse=True)[:top]
+
+
+def parse_output(output_xml: str) -> RunStats:
+    """Stream an output.xml into per-suite, per-tag and per-keyword statistics."""
+    stats = RunStats()
+    stack: List[ET.Element] = []
+    suites: List[str] = []
+
+    for event, elem in ET.iterparse(output_xml, events=('start', 'end')):
+        if event == 'start':
+            # <statistics> also contains <suite> elements; only count executed ones.
+            if elem.tag == 'suite' and stack[-1].tag in ('robot', 'suite'):
+                suites.append(elem.get('name'))
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        tag = elem.tag
+        if tag == 'suite' and stack[-1].tag not in ('robot', 'suite'):
+            tag = 'suite-statistics'
+        if tag == 'kw':
+            status = elem.find('status')
+            if status is not None:
+                owner = elem.get('owner') or elem.get('library')
+                name = f"{owner}.{elem.get('name')}" if owner else elem.get('name')
+                stats.keyword_names.setdefault(name, elem.get('name'))
+                stats.keywords.setdefault(name, _Bucket()).add(status.get('status'), status_elapsed(status))
+        elif tag == 'test':
+            status = elem.find('status')
+            stats.add_test(suites, elem.get('name'), status.get('status'), status_elapsed(status),
+                           [t.text for t in elem.findall('tag')], _start_time(status))
+        elif tag == 'suite':
+            if len(suites) == 1:
+                status = elem.find('status')
+                stats.start_time, stats.elapsed = _start_time(status), status_elapsed(status)
+            suites.pop()
+
+        if tag not in _KEEP and stack:
+            stack[-1].remove(elem)
+        elif tag not in _KEEP:
+            elem.clear()
+    return stats
+
+
+def load_profiles(output_xml: str) -> Dict[str, Dict[str, float]]:
+    """
+    Merge the keyword profiler outputs of the run that wrote ``output_xml``.
+
+    Only the profile next to it and those of its pabot workers
+    (``pabot_results/``) are read. A profile older than the output.xml
+    beside it was left by an earlier run and is skipped.
+    """
+    output_dir = Path(output_xml).parent
+    candidates = [output_dir / PROFILE_JSON, *sorted((output_dir / 'pabot_results').rglob(PROFILE_JSON))]
+    stats = RunStats()
+    for path in candidates:
+        sibling = Path(output_xml) if path.parent == output_dir else path.with_name('output.xml')
+        if not path.exists() or (sibling.exists() and path.stat().st_mtime_ns < sibling.stat().st_mtime_ns):
+            continue
+        stats.merge_profile(json.loads(path.read_text())['keywords'])
+    return stats.profile
+
+
+def _table(headers: List[str], rows: List[List[Any]]) -> str:
+    head = ''.join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+    body = ''.join(
+        '<tr>' + ''.join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + '</tr>' for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _bucket_rows(items) -> List[List[Any]]:
+    rows = []
+    for name, bucket in items:
+        data = bucket.to_dict()
+        rows.append([name, data['count'], data['passed'], data['failed'], data['skipped'],
+                     data['total_seconds'], data['avg_seconds'], data['max_seconds']])
+    return rows
+
+
+def render_html(stats: RunStats, title: str) -> str:
+    """Render the consolidated HTML report."""
+    columns = ['Name', 'Count', 'Pass', 'Fail', 'Skip', 'Total (s)', 'Avg (s)', 'Max (s)']
+    totals = stats.totals.to_dict()
+    sections = [
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p>Started {html.escape(stats.start_time)} &middot; {stats.elapsed:.1f}s &middot; "
+        f"{totals['passed']} passed, {totals['failed']} failed, {totals['skipped']} skipped</p>",
+        "<h2>Suites</h2>", _table(columns, _bucket_rows(sorted(stats.suites.items()))),
+        "<h2>Tags</h2>", _table(columns, _bucket_rows(sorted(stats.tags.items()))),
+        "<h2>Slowest keywords</h2>", _table(columns, _bucket_rows(stats.slowest_keywords())),
+    ]
+    if stats.profile:
+        profiled = sorted(stats.profile.items(), key=lambda item: item[1]['self_seconds'], reverse=True)
+        rows = [[name, entry['calls'], round(entry['wall_seconds'], 3), round(entry['self_seconds'], 3),
+                 round(entry['self_seconds'] / entry['calls'] * 1000, 1)] for name, entry in profiled[:20]]
+        sections += ["<h2>Keyword profile (self time)</h2>",
+                     _table(['Name', 'Calls', 'Wall (s)', 'Self (s)', 'Avg self (ms)'], rows)]
+    style = ("body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin-bottom:2em}"
+             "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}th{background:#eee}")
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+            f"<style>{style}</style></head><body>{''.join(sections)}</body></html>")
+
+
+def generate_report(output_xml: str, output_dir: str, title: str = 'dOCReader Test Report') -> RunStats:
+    """Write consolidated_report.html and metrics.json next to the results."""
+    stats = parse_output(output_xml)
+    stats.merge_profile(load_profiles(output_xml))
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    (output / 'metrics.json').write_text(json.dumps(stats.to_dict(), indent=2))
+    (output / 'consolidated_report.html').write_text(render_html(stats, title), encoding='utf-8')
+    return stats
+
+
+class ResultsStore:
+    """
+    Append-only SQLite history of test runs.
+
+    One row per run, per test and per keyword (with its duration histogram),
+    indexed by full name, short name (test name without suites, keyword name
+    without owner) and run so trend queries over the last N runs stay fast.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id INTEGER PRIMARY KEY, env TEXT, source TEXT, start_time TEXT,
+            elapsed REAL, passed INTEGER, failed INTEGER, skipped INTEGER, created_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS test_results (
+            run_id INTEGER, name TEXT, status TEXT, elapsed REAL, short_name TEXT
+        );
+        CREATE TABLE IF NOT EXISTS keyword_results (
+            run_id INTEGER, name TEXT, calls INTEGER, failed INTEGER,
+            total REAL, max REAL, histogram BLOB, short_name TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_env ON runs (env, run_id);
+        CREATE INDEX IF NOT EXISTS idx_test_name ON test_results (name, run_id);
+        CREATE INDEX IF NOT EXISTS idx_test_short_name ON test_results (short_name, run_id);
+        CREATE INDEX IF NOT EXISTS idx_keyword_name ON keyword_results (name, run_id);
+        CREATE INDEX IF NOT EXISTS idx_keyword_short_name ON keyword_results (short_name, run_id);
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(self.SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def append_run(self, stats: RunStats, env: str, source: str = '') -> int:
+        """Store one run's per-test and per-keyword results; returns the run id."""
+        totals = stats.totals
+        with self.db:
+            run_id = self.db.execute(
+                'INSERT INTO runs (env, source, start_time, elapsed, passed, failed, skipped, created_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (env, source, stats.start_time, stats.elapsed, totals.passed, totals.failed,
+                 totals.skipped, time.time()),
+            ).lastrowid
+            self.db.executemany(
+                'INSERT INTO test_results VALUES (?, ?, ?, ?, ?)',
+                ((run_id, test['name'], test['status'], test['elapsed'], test['test']) for test in stats.tests),
+            )
+            self.db.executemany(
+                'INSERT INTO keyword_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                ((run_id, name, b.passed + b.failed + b.skipped, b.failed, b.total, b.max,
+                  b.histogram.tobytes(), stats.keyword_names.get(name, name)) for name, b in stats.keywords.items()),
+            )
+        return run_id
+
+    def _last_runs(self, runs: int, env: Optional[str]) -> List[int]:
+        if env:
+            rows = self.db.execute('SELECT run_id FROM runs WHERE env = ? ORDER BY run_id DESC LIMIT ?',
+                                   (env, runs))
+        else:
+            rows = self.db.execute('SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?', (runs,))
+        return [row[0] for row in rows]
+
+    def keyword_percentile(self, name: str, percentile: float = 95, runs: int = 50,
+                           env: Optional[str] = None) -> float:
+        """
+        Approximate duration percentile (seconds) of a keyword over the last runs.
+
+        ``name`` may be the full ``Owner.Keyword`` name or just the keyword name.
+        Accuracy is bounded by the histogram bucket width (25%).
+        """
+        run_ids = self._last_runs(runs, env)
+        if not run_ids:
+            return 0.0
+        marks = ','.join('?' * len(run_ids))
+        histogram = array('I', bytes(4 * HIST_BUCKETS))
+        for (blob,) in self.db.execute(
+            f'SELECT histogram FROM keyword_results WHERE (name = ? OR short_name = ?) AND run_id IN ({marks})',
+            [name, name, *run_ids],
+        ):
+            for index, value in enumerate(array('I', blob)):
+                histogram[index] += value
+        return hist_percentile(histogram, percentile)
+
+    def test_percentile(self, name: str, percentile: float = 95, runs: int = 50,
+                        env: Optional[str] = None) -> float:
+        """Exact duration percentile (seconds) of a test (long or short name) over the last runs."""
+        run_ids = self._last_runs(runs, env)
+        if not run_ids:
+            return 0.0
+        marks = ','.join('?' * len(run_ids))
+        durations = sorted(row[0] for row in self.db.execute(
+            f'SELECT elapsed FROM test_results WHERE (name = ? OR short_name = ?) AND run_id IN ({marks})',
+            [name, name, *run_ids],
+        ))
+        if not durations:
+            return 0.0
+        return durations[min(len(durations) - 1, math.ceil(len(durations) * percentile / 100) - 1)]
+
+    def flaky_tests(self, runs: int = 20, env: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Tests that both passed and failed within the last runs, most failures first."""
+        run_ids = self._last_runs(runs, env)
+        if not run_ids:
+            return []
+        marks = ','.join('?' * len(run_ids))
+        rows = self.db.execute(
+            f"SELECT name, SUM(status = 'PASS'), SUM(status = 'FAIL') FROM test_results"
+            f" WHERE run_id IN ({marks}) GROUP BY name"
+            f" HAVING SUM(status = 'PASS') > 0 AND SUM(status = 'FAIL') > 0"
+            f" ORDER BY SUM(status = 'FAIL') DESC",
+            run_ids,
+        )
+        return [{'name': name, 'passed': passed, 'failed': failed} for name, passed, failed in rows]
+
+22. utils/generate_report.py
+python"""Generate the consolidated report and metrics for an environment's results.
+
+Each run is also appended to the SQLite results history
+(``.cache/history/results.sqlite``) unless ``--no-history`` is given.
+
+Usage:
+    python utils/generate_report.py --env qa
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from report_generator import ResultsStore, generate_report  # noqa: E402
+
+HISTORY_DB = ROOT / '.cache' / 'history' / 'results.sqlite'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate consolidated_report.html and metrics.json')
+    parser.add_argument('--env', default='qa')
+    parser.add_argument('--output-xml', default=None, help='Default: results/<env>/output.xml')
+    parser.add_argument('--output-dir', default=None, help='Default: results/<env>/')
+    parser.add_argument('--history', default=str(HISTORY_DB), help='SQLite results history to append to')
+    parser.add_argument('--no-history', action='store_true', help='Do not record this run in the history')
+    args = parser.parse_args()
+
+    results = ROOT / 'results' / args.env
+    output_xml = Path(args.output_xml) if args.output_xml else results / 'output.xml'
+    output_dir = Path(args.output_dir) if args.output_dir else results
+    if not output_xml.exists():
+        sys.exit(f"❌ {output_xml} not found")
+
+    stats = generate_report(str(output_xml), str(output_dir), f"dOCReader {args.env.upper()} Test Report")
+    totals = stats.totals.to_dict()
+    print(f"📊 {totals['count']} tests: {totals['passed']} passed, {totals['failed']} failed, "
+          f"{totals['skipped']} skipped; {len(stats.keywords)} distinct keywords")
+    print(f"✅ Report written to {output_dir}")
+
+    if not args.no_history:
+        store = ResultsStore(args.history)
+        try:
+            run_id = store.append_run(stats, args.env, str(output_xml))
+        finally:
+            store.close()
+        print(f"🗃️  Recorded as run {run_id} in {args.history}")
+
+
+if __name__ == '__main__':
+    main()
+
+23. utils/merge_results.py
+python"""Merge several output.xml files (pabot shards or environments) into one set of statistics.
+
+Each file is stream-parsed in its own process with ``report_generator``;
+the per-test results are then merged and written as a compact metrics.json
+and consolidated_report.html. ``--rebot`` additionally runs ``rebot`` for
+the standard log/report HTML; it is opt-in because rebot loads every
+output.xml in full again.
+
+Usage:
+    python utils/merge_results.py --output-dir results/merged \\
+        results/qa/output.xml results/prod/output.xml
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from report_generator import RunStats, load_profiles, parse_output, render_html  # noqa: E402
+
+
+def merge_stats(runs: List[RunStats], labels: List[str], mode: str = 'merge') -> RunStats:
+    """
+    Merge parsed runs into one RunStats.
+
+    ``merge`` keeps the last result of each test (like ``rebot --merge``);
+    ``combine`` keeps every result under a top-level suite named by its label.
+    Keyword statistics and profiles are summed over all inputs.
+    """
+    merged = RunStats()
+    latest = {}
+    for run, label in zip(runs, labels):
+        for test in run.tests:
+            suites = [label] + test['suites'] if mode == 'combine' else test['suites']
+            latest['.'.join(suites + [test['test']])] = (suites, test)
+        for name, bucket in run.keywords.items():
+            merged.keywords.setdefault(name, type(bucket)()).merge(bucket)
+        merged.keyword_names.update(run.keyword_names)
+        merged.merge_profile(run.profile)
+
+    for suites, test in latest.values():
+        merged.add_test(suites, test['test'], test['status'], test['elapsed'], test['tags'], test['start'])
+    starts = [run.start_time for run in runs if run.start_time]
+    merged.start_time = min(starts) if starts else ''
+    merged.elapsed = max((run.elapsed for run in runs), default=0.0)
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge Robot Framework output.xml files')
+    parser.add_argument('outputs', nargs='+', help='output.xml files to merge')
+    parser.add_argument('--output-dir', default='results/merged')
+    parser.add_argument('--name', default='Combined Results')
+    parser.add_argument('--mode', choices=('merge', 'combine'), default='merge')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--rebot', action='store_true', help='Also render log/report HTML with rebot')
+    args = parser.parse_args()
+
+    outputs = [path for path in args.outputs if Path(path).exists()]
+    missing = sorted(set(args.outputs) - set(outputs))
+    if missing:
+        print(f"⚠️  Skipping missing files: {', '.join(missing)}")
+    if not outputs:
+        sys.exit('❌ No output.xml files to merge')
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        runs = list(pool.map(parse_output, outputs))
+    for run, path in zip(runs, outputs):
+        run.merge_profile(load_profiles(path))
+    labels = [Path(path).parent.name or Path(path).stem for path in outputs]
+    merged = merge_stats(runs, labels, args.mode)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / 'metrics.json').write_text(
+        json.dumps(dict(merged.to_dict(), sources=outputs, mode=args.mode), indent=2)
+    )
+    (output_dir / 'consolidated_report.html').write_text(render_html(merged, args.name), encoding='utf-8')
+    totals = merged.totals.to_dict()
+    print(f"🔗 Merged {len(outputs)} file(s): {totals['count']} tests, "
+          f"{totals['passed']} passed, {totals['failed']} failed")
+
+    if args.rebot:
+        rebot = ['rebot', '--outputdir', str(output_dir), '--name', args.name, '--nostatusrc']
+        if args.mode == 'merge':
+            rebot.append('--merge')
+        subprocess.run(rebot + outputs, check=True)
+
+
+if __name__ == '__main__':
+    main()
+
+24. utils/results_history.py
+python"""Query the SQLite results history written by generate_report.py.
+
+Usage:
+    python utils/results_history.py p95 "Login To DocReader" --runs 50
+    python utils/results_history.py p95 "Verify PDF Download" --kind test --env qa
+    python utils/results_history.py flaky --runs 20
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from report_generator import ResultsStore  # noqa: E402
+
+HISTORY_DB = ROOT / '.cache' / 'history' / 'results.sqlite'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the test results history')
+    # Shared options, accepted after the subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--history', default=str(HISTORY_DB))
+    common.add_argument('--env', default=None, help='Only runs of this environment')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p95 = commands.add_parser('p95', parents=[common], help='Duration percentile of a keyword or test')
+    p95.add_argument('name')
+    p95.add_argument('--kind', choices=('keyword', 'test'), default='keyword')
+    p95.add_argument('--percentile', type=float, default=95)
+    p95.add_argument('--runs', type=int, default=50)
+
+    flaky = commands.add_parser('flaky', parents=[common], help='Tests that both passed and failed recently')
+    flaky.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    if not Path(args.history).exists():
+        sys.exit(f"❌ {args.history} not found, run utils/generate_report.py first")
+    store = ResultsStore(args.history)
+    try:
+        if args.command == 'p95':
+            query = store.keyword_percentile if args.kind == 'keyword' else store.test_percentile
+            seconds = query(args.name, args.percentile, args.runs, args.env)
+            print(f"⏱️  p{args.percentile:g} of {args.kind} '{args.name}' over the last "
+                  f"{args.runs} runs: {seconds:.3f}s")
+        else:
+            tests = store.flaky_tests(args.runs, args.env)
+            print(f"🎲 {len(tests)} flaky test(s) in the last {args.runs} runs")
+            for test in tests:
+                print(f"  {test['failed']:3d} fail / {test['passed']:3d} pass  {test['name']}")
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
+
+25. libraries/keyword_profiler.py
+python"""
+Keyword profiler listener (Robot Framework listener API v3).
+
+Records wall time, self time (wall time minus time spent in child keywords)
+and call counts per keyword, plus folded stacks for flame graphs. Enable it
+with a single flag:
+
+    robot --listener libraries/keyword_profiler.py tests/
+    pabot --listener libraries/keyword_profiler.py tests/
+
+When the run's output.xml is written, ``keyword_profile.json`` and
+``keyword_profile.folded`` are written next to it (one pair per pabot
+worker). ``report_generator`` merges the JSON files into the consolidated
+report; the folded files can be concatenated into ``flamegraph.pl``.
+"""
+
+import json
+import time
+from pathlib import Path
+
+ROBOT_LISTENER_API_VERSION = 3
+
+PROFILE_JSON = 'keyword_profile.json'
+PROFILE_FOLDED = 'keyword_profile.folded'
+
+# Profile state, written out by output_file()
+_keywords = {}  # name -> [calls, wall seconds, self seconds]
+_stacks = {}  # (root, kw, ..., kw) -> self seconds
+_frames = []  # [name, start, child seconds] of running keywords
+_path = []  # root (test or suite) followed by running keyword names
+
+_clock = time.perf_counter
+
+
+def _frame_name(name: str) -> str:
+    # ';' separates frames in the folded format
+    return name.replace(';', ',')
+
+
+def start_suite(data, result):
+    if not _path:
+        _path.append(_frame_name(result.full_name))
+
+
+def end_suite(data, result):
+    # Child suites end with only the root on the path too; pop it for the root suite alone
+    if result.parent is None:
+        _path.pop()
+
+
+def start_test(data, result):
+    _path.append(_frame_name(result.full_name))
+
+
+def end_test(data, result):
+    _path.pop()
+
+
+def start_keyword(data, result):
+    name = _frame_name(getattr(result, 'full_name', None) or result.name)
+    _frames.append([name, _clock(), 0.0])
+    _path.append(name)
+
+
+def end_keyword(data, result):
+    name, started, children = _frames.pop()
+    wall = _clock() - started
+    own = wall - children
+    if _frames:
+        _frames[-1][2] += wall
+
+    entry = _keywords.get(name)
+    if entry is None:
+        _keywords[name] = [1, wall, own]
+    else:
+        entry[0] += 1
+        entry[1] += wall
+        entry[2] += own
+    stack = tuple(_path)
+    _stacks[stack] = _stacks.get(stack, 0.0) + own
+    _path.pop()
+
+
+def output_file(path):
+    """Write the profile next to output.xml once Robot has finished writing it."""
+    directory = Path(path).parent
+    profile = {
+        name: {'calls': calls, 'wall_seconds': round(wall, 6), 'self_seconds': round(own, 6)}
+        for name, (calls, wall, own) in sorted(_keywords.items())
+    }
+    (directory / PROFILE_JSON).write_text(json.dumps({'keywords': profile}, indent=2))
+    # Folded stacks use integer microseconds, as flamegraph.pl expects
+    (directory / PROFILE_FOLDED).write_text(''.join(
+        f"{';'.join(stack)} {round(seconds * 1e6)}\n"
+        for stack, seconds in sorted(_stacks.items()) if seconds >= 1e-6
+    ))
+
+26. libraries/ui_helper.py
+python"""
+Condition-based UI waits on top of SeleniumLibrary.
+
+``Wait For Element And Click`` used to end with a fixed ``Sleep 0.5s``.
+Here the click is followed by a settle wait instead: it returns as soon as
+the page has finished loading and the DOM has seen no mutation for a short
+quiet window, so fast pages cost milliseconds instead of half a second.
+
+Timeouts come from ``timeouts.element`` and ``timeouts.dom_settle``. With
+``browser.click_wait: compat`` the keyword still sleeps up to the legacy
+0.5s after settling, behaving exactly as before while reporting how much
+sleep time the condition-based wait would remove, and how much it adds on
+clicks where settling takes longer than 0.5s.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import timestr_to_secs
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.config_manager import get_config  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'get_wait_savings',
+    'wait_for_element_and_click',
+    'wait_for_page_to_settle',
+]
+
+LEGACY_SLEEP = 0.5
+POLL_INTERVAL = 0.05
+
+# Resolves once the document is loaded and no DOM mutation happened for
+# ``quiet`` ms, or after ``limit`` ms at the latest (never hits the script timeout).
+_SETTLE_SCRIPT = """
+var quiet = arguments[0], limit = arguments[1], done = arguments[arguments.length - 1];
+var timer = null, observer = null;
+function finish(settled) {
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    done(settled);
+}
+function arm() {
+    clearTimeout(timer);
+    timer = setTimeout(function () { finish(true); }, quiet);
+}
+function observe() {
+    observer = new MutationObserver(arm);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    arm();
+}
+setTimeout(function () { finish(false); }, limit);
+if (document.readyState === 'complete') { observe(); }
+else { window.addEventListener('load', observe); }
+"""
+
+# Running totals, reported by Get Wait Savings
+_stats = {'clicks': 0, 'settle_seconds': 0.0, 'sleep_removed_seconds': 0.0, 'sleep_added_seconds': 0.0}
+
+
+def _selenium():
+    return BuiltIn().get_library_instance('SeleniumLibrary')
+
+
+def _timeout(value, key: str, default: float) -> float:
+    if value is None or value == '':
+        return float(get_config().get(key, default))
+    return timestr_to_secs(value)
+
+
+def _wait_clickable(selenium, locator: str, timeout: float):
+    """Poll until the element is displayed and enabled; returns the element."""
+    from selenium.common.exceptions import StaleElementReferenceException
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            # find_elements returns [] instead of failing while the element is missing
+            elements = selenium.find_elements(locator)
+            if elements and elements[0].is_displayed() and elements[0].is_enabled():
+                return elements[0]
+        except StaleElementReferenceException:
+            pass
+        if time.monotonic() >= deadline:
+            raise AssertionError(f"Element '{locator}' was not visible and enabled after {timeout:g}s")
+        time.sleep(POLL_INTERVAL)
+
+
+def _settle(driver, timeout: float, quiet_ms: int) -> bool:
+    """
+    Wait for the page to load and the DOM to stop changing.
+
+    A click that navigates away unloads the document under the script; in
+    that case wait for the new document's ``readyState`` instead.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    deadline = time.monotonic() + timeout
+    try:
+        return bool(driver.execute_async_script(_SETTLE_SCRIPT, int(quiet_ms), int(timeout * 1000)))
+    except WebDriverException:
+        while time.monotonic() < deadline:
+            try:
+                if driver.execute_script('return document.readyState') == 'complete':
+                    return True
+            except WebDriverException:
+                pass
+            time.sleep(POLL_INTERVAL)
+        return False
+
+
+def wait_for_page_to_settle(timeout: str = None, quiet_ms: int = 100) -> float:
+    """
+    Wait until the page is loaded and the DOM has been quiet for ``quiet_ms``.
+
+    Args:
+        timeout: Upper bound (default: ``timeouts.dom_settle``)
+        quiet_ms: Mutation-free window that counts as settled
+
+    Returns:
+        Seconds spent waiting
+    """
+    limit = _timeout(timeout, 'timeouts.dom_settle', 2)
+    started = time.monotonic()
+    if not _settle(_selenium().driver, limit, quiet_ms):
+        logger.info(f"Page still changing after {limit:g}s, continuing")
+    return time.monotonic() - started
+
+
+def wait_for_element_and_click(locator: str, timeout: str = None, mode: str = None) -> float:
+    """
+    Wait for an element to be visible and enabled, click it and wait for the page to settle.
+
+    Args:
+        locator: SeleniumLibrary locator
+        timeout: Wait for the element (default: ``timeouts.element``)
+        mode: ``condition`` (settle only) or ``compat`` (settle, then sleep
+            the rest of the legacy 0.5s and report the difference); default
+            ``browser.click_wait``
+
+    Returns:
+        Seconds spent settling after the click
+    """
+    mode = mode or get_config().get('browser.click_wait', 'condition')
+    if mode not in ('condition', 'compat'):
+        raise ValueError(f"Unsupported click wait mode: {mode}")
+    selenium = _selenium()
+
+    _wait_clickable(selenium, locator, _timeout(timeout, 'timeouts.element', 10)).click()
+    settled = wait_for_page_to_settle()
+
+    saved = LEGACY_SLEEP - settled
+    _stats['clicks'] += 1
+    _stats['settle_seconds'] += settled
+    _stats['sleep_removed_seconds'] += max(saved, 0.0)
+    _stats['sleep_added_seconds'] += max(-saved, 0.0)
+    if mode == 'compat':
+        net = _stats['sleep_removed_seconds'] - _stats['sleep_added_seconds']
+        logger.info(f"Settled in {settled:.3f}s, {saved:+.3f}s against the {LEGACY_SLEEP}s sleep "
+                    f"({net:+.1f}s net so far)")
+        time.sleep(max(saved, 0.0))
+    return settled
+
+
+def get_wait_savings() -> Dict[str, Any]:
+    """
+    Return click/settle totals for this process.
+
+    Returns:
+        Dictionary with ``clicks``, ``settle_seconds``,
+        ``sleep_removed_seconds`` (fixed sleep avoided compared to 0.5s per
+        click), ``sleep_added_seconds`` (settle time beyond 0.5s on slow
+        clicks) and their difference ``net_seconds``
+    """
+    savings = {key: round(value, 3) for key, value in _stats.items()}
+    savings['net_seconds'] = round(_stats['sleep_removed_seconds'] - _stats['sleep_added_seconds'], 3)
+    logger.info(f"Condition-based waits: {savings}")
+    return savings
+
+27. libraries/browser_pool.py
+python"""
+Warm, authenticated browser per pabot worker.
+
+Instead of launching Chrome and logging in for every suite, each pabot
+worker (``${PABOTEXECUTIONPOOLID}``) keeps one headless Chrome running with
+its own profile directory under ``.cache/browsers/<run id>``. The run id is
+``BROWSER_POOL_RUN_ID``, else ``CI_JOB_ID``, so concurrent jobs never share
+a profile. Chrome picks a free remote-debugging port itself and publishes it
+in the profile's ``DevToolsActivePort`` file. Suites attach to it through
+chromedriver's ``debuggerAddress``; closing the WebDriver session leaves
+Chrome, and its session cookies, running for the next suite. Between tests
+the page state is reset by clearing local/session storage and navigating to
+the dashboard.
+
+The browsers outlive the Robot processes, so the run ends with
+``utils/shutdown_browsers.py``, which stops every Chrome of the run.
+"""
+
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.config_manager import get_config  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'open_pooled_application',
+    'release_pooled_application',
+    'reset_pooled_application',
+    'shutdown_pooled_browser',
+]
+
+PROFILE_DIR = Path('.cache/browsers')
+PID_FILE = 'chrome.pid'
+PORT_FILE = 'DevToolsActivePort'
+DASHBOARD_LOCATOR = "xpath=//h1[contains(text(),'Dashboard')]"
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')
+
+# Running totals, returned by Open Pooled Application
+_stats = {'launched': 0, 'attached': 0, 'logins': 0, 'resets': 0}
+
+
+def _selenium():
+    return BuiltIn().get_library_instance('SeleniumLibrary')
+
+
+def _run_id() -> str:
+    return os.getenv('BROWSER_POOL_RUN_ID') or os.getenv('CI_JOB_ID') or 'local'
+
+
+def _profile() -> Path:
+    worker = int(BuiltIn().get_variable_value('${PABOTEXECUTIONPOOLID}', 0) or 0)
+    return PROFILE_DIR / _run_id() / f"worker-{worker}"
+
+
+def _debugger_alive(port: int) -> bool:
+    try:
+        return requests.get(f"http://127.0.0.1:{port}/json/version", timeout=0.5).ok
+    except requests.RequestException:
+        return False
+
+
+def _debugger_port(profile: Path) -> Optional[int]:
+    """Debugging port of the Chrome running on ``profile``, or None if there is none."""
+    try:
+        port = int((profile / PORT_FILE).read_text().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return port if _debugger_alive(port) else None
+
+
+def _launch_chrome(profile: Path) -> int:
+    """Start a detached headless Chrome that outlives this Robot process; returns its debugging port."""
+    config = get_config()
+    binary = config.get('browser.binary') or next(filter(None, map(shutil.which, CHROME_BINARIES)), None)
+    if not binary:
+        raise RuntimeError('Chrome not found; set browser.binary in the config')
+    width, _, height = str(config.get('browser.window_size', '1920x1080')).partition('x')
+    profile.mkdir(parents=True, exist_ok=True)
+    (profile / PORT_FILE).unlink(missing_ok=True)
+    args = [binary, '--remote-debugging-port=0', f"--user-data-dir={profile.resolve()}",
+            f"--window-size={width},{height}", '--no-first-run', '--no-default-browser-check']
+    if config.get('browser.headless', True):
+        args.append('--headless=new')
+    process = subprocess.Popen(args + ['about:blank'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    (profile / PID_FILE).write_text(str(process.pid))
+
+    deadline = time.monotonic() + 15
+    port = _debugger_port(profile)
+    while port is None:
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"Chrome did not open a debugging port for {profile}")
+        time.sleep(0.1)
+        port = _debugger_port(profile)
+    _stats['launched'] += 1
+    return port
+
+
+def _stop_chrome(profile: Path) -> bool:
+    """Terminate the Chrome running on ``profile`` (its whole process group); True if one was running."""
+    if _debugger_port(profile) is None:
+        return False
+    try:
+        pid = int((profile / PID_FILE).read_text())
+        if hasattr(os, 'killpg'):
+            os.killpg(pid, signal.SIGTERM)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _dashboard_url() -> str:
+    config = get_config()
+    return config.get('environment.url').rstrip('/') + config.get('browser.dashboard_path', '/dashboard')
+
+
+def _on_dashboard(timeout: float) -> bool:
+    """Poll for the dashboard heading with the implicit wait off, so a miss costs ``timeout`` at most."""
+    selenium = _selenium()
+    # Every new driver gets the library's implicit wait, not only the first one
+    previous = selenium.set_selenium_implicit_wait('0s')
+    try:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if selenium.find_elements(DASHBOARD_LOCATOR):
+                return True
+            time.sleep(0.1)
+        return False
+    finally:
+        selenium.set_selenium_implicit_wait(previous)
+
+
+def open_pooled_application() -> Dict[str, Any]:
+    """
+    Attach to this worker's warm browser and make sure it is logged in, on the dashboard.
+
+    Launches Chrome on first use. Logs in with ``credentials.*`` (through
+    ``Login To Application``) only when the reused cookies no longer give
+    access to the dashboard.
+
+    Returns:
+        Reuse counters for this process (launched, attached, logins, resets)
+    """
+    config = get_config()
+    profile = _profile()
+    port = _debugger_port(profile) or _launch_chrome(profile)
+
+    selenium = _selenium()
+    selenium.open_browser(
+        'about:blank', 'chrome', options=f'add_experimental_option("debuggerAddress", "127.0.0.1:{port}")'
+    )
+    selenium.set_selenium_timeout(f"{config.get('timeouts.page_load', 30)}s")
+    _stats['attached'] += 1
+
+    selenium.go_to(_dashboard_url())
+    if not _on_dashboard(2):
+        selenium.go_to(config.get('environment.url'))
+        BuiltIn().run_keyword('Login To Application', config.get('credentials.username'),
+                              config.get('credentials.password'))
+        _stats['logins'] += 1
+    selenium.set_selenium_implicit_wait(f"{config.get('browser.implicit_wait', 5)}s")
+    logger.info(f"Pooled browser on port {port}: {_stats}")
+    return dict(_stats)
+
+
+def reset_pooled_application():
+    """Clear local/session storage and return to the dashboard, keeping the login cookies."""
+    selenium = _selenium()
+    selenium.driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+    selenium.go_to(_dashboard_url())
+    _stats['resets'] += 1
+    if not _on_dashboard(5):
+        raise AssertionError('Dashboard not reachable after reset; session may have expired')
+
+
+def release_pooled_application():
+    """End the WebDriver session but leave the warm browser running for the next suite."""
+    _selenium().close_all_browsers()
+
+
+def shutdown_pooled_browser():
+    """Close this worker's pooled Chrome."""
+    _selenium().close_all_browsers()
+    _stop_chrome(_profile())
+
+
+def shutdown_run_browsers(run_id: str = None) -> int:
+    """
+    Stop every pooled Chrome of a run and remove its profiles.
+
+    Not a keyword: called once at the end of the run, outside Robot, by
+    ``utils/shutdown_browsers.py``.
+
+    Args:
+        run_id: Run whose browsers to stop (default: the current run id)
+
+    Returns:
+        Number of browsers that were running
+    """
+    run_dir = PROFILE_DIR / (run_id or _run_id())
+    stopped = sum(_stop_chrome(profile) for profile in sorted(run_dir.glob('worker-*')))
+    shutil.rmtree(run_dir, ignore_errors=True)
+    return stopped
+
+28. libraries/jar_helper.py
+python"""
+Diagram XML access in MITO ``Generated.jar`` files.
+
+The jar is opened once per process with ``zipfile``, so its central
+directory is parsed once and kept together with an index from diagram name
+to ``ic_diagram.xml`` member; members are then read by offset on demand.
+Diagram XML is stream-parsed with ``iterparse``: tags are counted and
+attributes collected as elements start, and each element is dropped once it
+ends, so no tree is kept.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Robot Framework keywords exported by this library
+__all__ = [
+    'count_diagram_tags',
+    'get_block_counts_from_jar',
+    'get_diagram_attributes',
+    'get_diagram_member',
+    'get_diagram_names',
+]
+
+DIAGRAM_FILE = 'ic_diagram.xml'
+BLOCK_TAGS = ('afi', 'compound')
+
+
+def _local(tag: str) -> str:
+    return tag.rpartition('}')[2]
+
+
+class JarArchive:
+    """An open jar with its diagram-name index."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        # Diagram name is the folder holding ic_diagram.xml
+        self.members: Dict[str, str] = {}
+        for member in self.zip.namelist():
+            if member.rpartition('/')[2] == DIAGRAM_FILE:
+                self.members.setdefault(Path(member).parent.name, member)
+        self._root_names: Optional[Dict[str, str]] = None
+
+    def member(self, diagram: str) -> str:
+        """Zip member of a diagram, falling back to the diagrams' root ``name`` attribute."""
+        member = self.members.get(diagram)
+        if member is None:
+            if self._root_names is None:
+                self._root_names = {}
+                for candidate in self.members.values():
+                    with self.zip.open(candidate) as stream:
+                        for _, elem in ET.iterparse(stream, events=('start',)):
+                            self._root_names.setdefault(elem.get('name', ''), candidate)
+                            break
+            member = self._root_names.get(diagram)
+        if member is None:
+            raise AssertionError(f"Diagram '{diagram}' not found in {self.path}")
+        return member
+
+    def member_digest(self, diagram: str) -> str:
+        """Content fingerprint of a diagram's XML from the central directory (CRC-32 and size)."""
+        info = self.zip.getinfo(self.member(diagram))
+        return f"{info.CRC:08x}:{info.file_size}"
+
+    def scan(self, diagram: str, count: Sequence[str] = BLOCK_TAGS,
+             collect: Dict[str, Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Stream one diagram's XML once.
+
+        Args:
+            diagram: Diagram name
+            count: Tags to count (all occurrences, nested ones included)
+            collect: Tag to attribute names to collect for each occurrence
+
+        Returns:
+            ``{'counts': {tag: n}, 'attributes': {tag: [{attr: value}]}}``
+        """
+        collect = collect or {}
+        counts = dict.fromkeys(count, 0)
+        attributes: Dict[str, List[Dict[str, str]]] = {tag: [] for tag in collect}
+        stack: List[ET.Element] = []
+        with self.zip.open(self.member(diagram)) as stream:
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    tag = _local(elem.tag)
+                    if tag in counts:
+                        counts[tag] += 1
+                    if tag in attributes:
+                        attributes[tag].append({name: elem.get(name) for name in collect[tag]})
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if stack:
+                    stack[-1].remove(elem)
+                elem.clear()
+        return {'counts': counts, 'attributes': attributes}
+
+    def close(self):
+        self.zip.close()
+
+
+# Path -> (process id and change stamp, JarArchive). The process id keeps a
+# forked pool worker from reusing the parent's zip file handle, whose shared
+# file offset would interleave the workers' reads.
+_archives: Dict[str, tuple] = {}
+
+
+def open_jar(jar_path: str) -> JarArchive:
+    """Cached JarArchive for this process, reopened when the jar file changes or the process forked."""
+    path = Path(jar_path)
+    if not path.exists():
+        raise AssertionError(f"Jar {jar_path} not found")
+    stat = path.stat()
+    key = (os.getpid(), stat.st_mtime_ns, stat.st_size)
+    cached = _archives.get(str(path))
+    if cached and cached[0] == key:
+        return cached[1]
+    if cached:
+        cached[1].close()
+    archive = JarArchive(str(path))
+    _archives[str(path)] = (key, archive)
+    return archive
+
+
+def get_diagram_names(jar_path: str) -> List[str]:
+    """Return the names of all diagrams in a jar (from the cached index)."""
+    return sorted(open_jar(jar_path).members)
+
+
+def get_diagram_member(jar_path: str, diagram: str) -> str:
+    """Return the zip member holding a diagram's ``ic_diagram.xml``."""
+    return open_jar(jar_path).member(diagram)
+
+
+def count_diagram_tags(jar_path: str, diagram: str, *tags: str) -> Dict[str, int]:
+    """
+    Count tags in a diagram's XML without building a DOM.
+
+    Args:
+        jar_path: Path of ``Generated.jar``
+        diagram: Diagram name such as ``=7BHA01GH001``
+        tags: Tags to count (default: ``afi`` and ``compound``)
+
+    Returns:
+        Dictionary of tag to count
+    """
+    return open_jar(jar_path).scan(diagram, tags or BLOCK_TAGS)['counts']
+
+
+def get_diagram_attributes(jar_path: str, diagram: str, tag: str, *attributes: str) -> List[Dict[str, str]]:
+    """Return the given attributes of every ``tag`` element of a diagram, in document order."""
+    return open_jar(jar_path).scan(diagram, (), {tag: attributes})['attributes'][tag]
+
+
+def get_block_counts_from_jar(jar_path: str, diagrams: Iterable[str] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Count ``<afi>`` and ``<compound>`` nodes of several diagrams.
+
+    The result is the ``actual_counts`` argument of ``Verify Block Counts``.
+
+    Args:
+        jar_path: Path of ``Generated.jar``
+        diagrams: Diagram names (default: every diagram in the jar)
+    """
+    archive = open_jar(jar_path)
+    names = list(diagrams) if diagrams else sorted(archive.members)
+    return {name: archive.scan(name)['counts'] for name in names}
+
+29. libraries/mito_validator.py
+python"""
+Batch verification of every diagram in a MITO project.
+
+The per-test validators open ``MITO.db`` and ``Generated.jar`` again for each
+diagram. Here the database is read once, with one set-based query per
+check, and the jar is opened once per worker process. Each diagram's XML is
+stream-parsed a single time for the union of what all validators need, and
+every validator reads from that shared scan. Diagrams are spread over a
+process pool and the outcome is one consolidated result.
+
+Validators are registered in ``VALIDATORS``: each declares the tags it
+needs counted in the XML and a check taking the diagram's expected DB values
+and its shared scan.
+
+Runs are incremental: each diagram's verdict is stored under
+``.cache/mito`` with a key hashed from its database rows and its XML
+member, and only diagrams whose key changed are checked again.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Sequence
+
+from robot.api import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from database_helper import get_expected_block_counts, open_project_db, project_db_stamp  # noqa: E402
+from jar_helper import BLOCK_TAGS, open_jar  # noqa: E402
+
+# Robot Framework keywords exported by this library
+__all__ = ['verify_project_diagrams']
+
+# Tables feeding the checks: rows grouped by diagram_name, and lookup tables shared by all diagrams
+DIAGRAM_TABLES = ('diagram_blocks', 'diagram_parameter')
+SHARED_TABLES = ('functionmappinginfo',)
+VERDICT_CACHE_DIR = '.cache/mito'
+# Bump when a check changes so stored verdicts are not reused
+VERDICT_VERSION = 1
+
+
+def _check_blocks(expected: Dict[str, int], scan: Dict[str, Any]) -> Dict[str, Any]:
+    """BlockValidator rule: afi + compound nodes match diagram_blocks, compound nodes match compounds."""
+    counts = scan['counts']
+    actual_blocks = counts['afi'] + counts['compound']
+    return {
+        'ok': actual_blocks == expected['blocks'] and counts['compound'] == expected['compounds'],
+        'expected_blocks': expected['blocks'], 'actual_blocks': actual_blocks,
+        'expected_compounds': expected['compounds'], 'actual_compounds': counts['compound'],
+    }
+
+
+# name -> (XML tags to count, check(expected DB values, shared scan))
+VALIDATORS: Dict[str, tuple] = {
+    'block': (BLOCK_TAGS, _check_blocks),
+}
+
+
+def _verify_chunk(task) -> Dict[str, Dict[str, Any]]:
+    """Scan and check a chunk of diagrams in a worker; the jar stays open per process."""
+    jar_path, diagrams, expected, names = task
+    archive = open_jar(jar_path)
+    tags = sorted({tag for name in names for tag in VALIDATORS[name][0]})
+    results = {}
+    for diagram in diagrams:
+        try:
+            scan = archive.scan(diagram, tags)
+        except AssertionError as error:
+            results[diagram] = {name: {'ok': False, 'error': str(error)} for name in names}
+            continue
+        results[diagram] = {name: VALIDATORS[name][1](expected[diagram], scan) for name in names}
+    return results
+
+
+def _cache_file(db_path: str, jar_path: str) -> Path:
+    project = f"{Path(db_path).resolve()}|{Path(jar_path).resolve()}"
+    return Path(VERDICT_CACHE_DIR) / f"{hashlib.sha256(project.encode()).hexdigest()[:16]}.json"
+
+
+def _file_stamp(path: str) -> list:
+    stat = Path(path).stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_cache(path: Path) -> Dict[str, Any]:
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get('version') == VERDICT_VERSION else {}
+
+
+def _save_cache(path: Path, cache: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.json')
+    with os.fdopen(fd, 'w') as file:
+        json.dump(cache, file)
+    os.replace(tmp_path, path)
+
+
+def _diagram_keys(db_path: str, jar_path: str, diagrams: Sequence[str], names: Sequence[str]) -> Dict[str, str]:
+    """Hash each diagram's database rows, shared lookup tables, XML member and validator set."""
+    project = open_project_db(db_path)
+    tables = {row[0] for row in project.query("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    shared = hashlib.sha256(f"{VERDICT_VERSION}|{','.join(sorted(names))}".encode())
+    for table in SHARED_TABLES:
+        if table in tables:
+            shared.update(project.row_digests(table).get(None, '').encode())
+    per_table = [project.row_digests(table, 'diagram_name') for table in DIAGRAM_TABLES if table in tables]
+
+    archive = open_jar(jar_path)
+    keys = {}
+    for diagram in diagrams:
+        digest = shared.copy()
+        for digests in per_table:
+            digest.update(digests.get(diagram, '-').encode())
+        try:
+            digest.update(archive.member_digest(diagram).encode())
+        except AssertionError:
+            digest.update(b'missing')
+        keys[diagram] = digest.hexdigest()
+    return keys
+
+
+def verify_project_diagrams(db_path: str, jar_path: str, validators: Sequence[str] = ('block',),
+                            workers: int = None, output: str = None,
+                            diagrams: Sequence[str] = None, incremental: bool = True) -> Dict[str, Any]:
+    """
+    Verify every diagram of a project in parallel and return one consolidated result.
+
+    Args:
+        db_path: Path of the project's ``MITO.db``
+        jar_path: Path of the project's ``Generated.jar``
+        validators: Validator names from ``VALIDATORS``
+        workers: Process count (default: CPU count)
+        output: Optional JSON file for the consolidated result
+        diagrams: Diagram names to check (default: all in the database and the jar)
+        incremental: Reuse stored verdicts of diagrams whose inputs did not change
+
+    Returns:
+        Dictionary with ``total``, ``rechecked``, ``failed`` (diagram names)
+        and per-diagram ``results``
+    """
+    names = list(validators)
+    unknown = [name for name in names if name not in VALIDATORS]
+    if unknown:
+        raise ValueError(f"Unknown validators: {', '.join(unknown)}")
+
+    expected = get_expected_block_counts(db_path)
+    selected = sorted(diagrams or (expected.keys() | open_jar(jar_path).members.keys()))
+    for diagram in selected:
+        expected.setdefault(diagram, {'blocks': 0, 'compounds': 0})
+
+    cache_file = _cache_file(db_path, jar_path)
+    cache = _load_cache(cache_file) if incremental else {}
+    # The database stamp covers its -wal log, which holds commits not yet checkpointed
+    stamps = [list(project_db_stamp(db_path)), _file_stamp(jar_path)]
+    if cache.get('stamps') == stamps and sorted(cache.get('names', [])) == sorted(names):
+        # Neither file was touched: keys from the last run still hold
+        keys = {diagram: cache['keys'].get(diagram) or '' for diagram in selected}
+        missing = [diagram for diagram, key in keys.items() if not key]
+        keys.update(_diagram_keys(db_path, jar_path, missing, names) if missing else {})
+    else:
+        keys = _diagram_keys(db_path, jar_path, selected, names)
+    stored_keys, stored = cache.get('keys', {}), cache.get('verdicts', {})
+    stale = [diagram for diagram in selected if stored_keys.get(diagram) != keys[diagram] or diagram not in stored]
+
+    results: Dict[str, Dict[str, Any]] = {diagram: stored[diagram] for diagram in selected if diagram not in stale}
+    if stale:
+        workers = int(workers) if workers else os.cpu_count() or 1
+        size = max(1, -(-len(stale) // (workers * 4)))
+        chunks = [stale[start:start + size] for start in range(0, len(stale), size)]
+        tasks = [(jar_path, chunk, {diagram: expected[diagram] for diagram in chunk}, names) for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(_verify_chunk, tasks):
+                results.update(chunk)
+    results = {diagram: results[diagram] for diagram in selected}
+
+    _save_cache(cache_file, {
+        'version': VERDICT_VERSION, 'names': names, 'stamps': stamps,
+        'keys': dict(stored_keys, **keys), 'verdicts': dict(stored, **results),
+    })
+
+    failed = [diagram for diagram, checks in results.items() if not all(c['ok'] for c in checks.values())]
+    summary = {'db_path': db_path, 'jar_path': jar_path, 'validators': names, 'total': len(results),
+               'rechecked': len(stale), 'failed': failed, 'results': results}
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(json.dumps(summary, indent=2))
+
+    logger.info(f"Verified {len(results)} diagram(s) with {', '.join(names)} ({len(stale)} rechecked, "
+                f"{len(results) - len(stale)} reused): {len(failed)} failed")
+    if failed:
+        raise AssertionError(f"{len(failed)} of {len(results)} diagram(s) failed verification: "
+                             f"{', '.join(failed[:20])}")
+    return summary
+
+30. utils/verify_mito_project.py
+python"""Verify every diagram of a MITO project in one batch run.
+
+Paths come from the command line or from the ``batchVerification`` entry of
+``testdata/execution-data.json``. Diagrams whose database rows and XML are
+unchanged since the last run reuse their stored verdict unless ``--full``
+is given.
+
+Usage:
+    python utils/verify_mito_project.py --db C:/MITO/Project1/MITO.db --jar C:/MITO/Project1/Generated.jar
+    python utils/verify_mito_project.py --execution-data testdata/execution-data.json --workers 8
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from mito_validator import VALIDATORS, verify_project_diagrams  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch-verify all diagrams of a MITO project')
+    parser.add_argument('--db', help='Path of MITO.db')
+    parser.add_argument('--jar', help='Path of Generated.jar')
+    parser.add_argument('--execution-data', help='execution-data.json with a batchVerification entry')
+    parser.add_argument('--validators', nargs='+', default=sorted(VALIDATORS), choices=sorted(VALIDATORS))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output', default='results/mito/batch_verification.json')
+    parser.add_argument('--full', action='store_true', help='Recheck every diagram, ignoring stored verdicts')
+    args = parser.parse_args()
+
+    db_path, jar_path, workers = args.db, args.jar, args.workers
+    if args.execution_data:
+        batch = json.loads(Path(args.execution_data).read_text())['batchVerification']
+        db_path = db_path or batch['dbPath']
+        jar_path = jar_path or batch['jarPath']
+        workers = workers or batch.get('workers')
+    if not db_path or not jar_path:
+        sys.exit('❌ Give --db and --jar, or --execution-data')
+
+    try:
+        summary = verify_project_diagrams(db_path, jar_path, args.validators, workers, args.output,
+                                          incremental=not args.full)
+    except AssertionError as error:
+        print(f"❌ {error}")
+        print(f"📄 Details in {args.output}")
+        sys.exit(1)
+    print(f"✅ {summary['total']} diagram(s) verified ({', '.join(summary['validators'])}), "
+          f"{summary['rechecked']} rechecked")
+    print(f"📄 Details in {args.output}")
+
+
+if __name__ == '__main__':
+    main()
+
+31. utils/shutdown_browsers.py
+python"""Stop the pooled Chrome browsers of a test run.
+
+``browser_pool`` keeps one Chrome per pabot worker running across suites;
+run this once after the run (also when it failed) to stop them and remove
+their profiles.
+
+Usage:
+    python utils/shutdown_browsers.py
+    python utils/shutdown_browsers.py --run-id 123456
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'libraries'))
+
+from browser_pool import shutdown_run_browsers  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stop the pooled browsers of a test run')
+    parser.add_argument('--run-id', default=None,
+                        help='Default: BROWSER_POOL_RUN_ID, else CI_JOB_ID, else "local"')
+    args = parser.parse_args()
+
+    stopped = shutdown_run_browsers(args.run_id)
+    print(f"🧹 Stopped {stopped} pooled browser(s)")
+
+
+if __name__ == '__main__':
+    main()
+
 🚀 Setup & Execution Instructions
 Initial Setup (One-time)
 bash# Clone repository
@@ -18,6 +18,11 @@ JSON
     "dbPath": "C:/MITO/Project2/MITO.db",
     "jarPath": "C:/MITO/Project2/Generated.jar",
     "diagramName": "=7BHA01GH001"
+  },
+  "batchVerification": {
+    "dbPath": "C:/MITO/Project1/MITO.db",
+    "jarPath": "C:/MITO/Project1/Generated.jar",
+    "workers": 8
   }
 }
 